@@ -1,7 +1,7 @@
 from loader import config
 from console import Console
 from core.bot import Bot
-from loader import file_operations
+from loader import file_operations, rhino_session, web3_pool, rpc_pool, rpc_batch, signer, receipt_tracker, bridge_tracker
 
 
 class ApplicationManager:
@@ -10,10 +10,21 @@ class ApplicationManager:
     async def run() -> None:
         await file_operations.setup_files()
 
-        while True:
-            await Console().build()
+        try:
+            while True:
+                await Console().build()
 
-            if config.module == "swap_bnb_via_rhino":
-                await Bot().process_swaps()
+                if config.module == "swap_bnb_via_rhino":
+                    await Bot().process_swaps()
 
-            input("\nPress Enter to continue...")
+                input("\nPress Enter to continue...")
+        finally:
+            if receipt_tracker:
+                await receipt_tracker.close()
+            if bridge_tracker:
+                await bridge_tracker.close()
+            await rhino_session.close()
+            await rpc_pool.close()
+            await web3_pool.close()
+            await rpc_batch.close()
+            await signer.close()
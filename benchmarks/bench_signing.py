@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import os
+import secrets
+import sys
+import time
+
+sys.path.append(os.path.realpath("."))
+
+from core.bridge_tx import build_deposit_tx
+from core.signer import ProcessPoolSigner, TransactionSigner
+
+
+def make_wallets(count: int) -> list[str]:
+    return ["0x" + secrets.token_hex(32) for _ in range(count)]
+
+
+def make_tx(index: int) -> dict:
+    return build_deposit_tx(
+        bridge_address="0x" + "11" * 20,
+        chain_id=204,
+        commitment_id=index + 1,
+        value_wei=10 ** 15,
+        nonce=0,
+        gas=60_000,
+        gas_price=10 ** 6,
+    )
+
+
+async def bench(name: str, signer: TransactionSigner, wallets: list[str]) -> None:
+    started = time.perf_counter()
+    addresses = await signer.derive_addresses(wallets)
+    derive_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await asyncio.gather(*(signer.sign(key, make_tx(i)) for i, key in enumerate(wallets)))
+    sign_elapsed = time.perf_counter() - started
+
+    await signer.close()
+
+    print(
+        f"{name:<8} | derive: {len(addresses) / derive_elapsed:>10.0f} keys/s "
+        f"| sign: {len(wallets) / sign_elapsed:>10.0f} tx/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare in-thread and process pool signing throughput")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    wallets = make_wallets(args.count)
+    print(f"Signing {args.count} deposit transactions")
+
+    await bench("thread", TransactionSigner(), wallets)
+    await bench("process", ProcessPoolSigner(args.workers), wallets)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,72 +1,277 @@
 import asyncio
-import random
+import time
 
-from typing import Optional
+from typing import Optional, Dict, List, Set
 from loguru import logger
 
+from core.pipeline import StagePool, SwapJob, SwapPipeline
+from core.scheduler import StartScheduler
 from core.swap_module import RhinoSwapModule
-from loader import config, semaphore, file_operations
+from loader import (
+    config, concurrency, metrics, file_operations, rhino_session, rhino_configs, rpc_pool, wallet_states,
+    gas_oracle, gas_limits, signer, retry_policy, journal, nonces, max_deposit_wei, rpc_batch,
+    receipt_tracker, bridge_tracker, sign_threads,
+)
+from core.journal import RunJournal
+from models import BridgeOutcome, SwapRecord, TxOutcome, WalletState
 
 
 class Bot:
+    MAX_PENDING_WALLETS = 1000
+    MAX_STATE_AGE = 30.0
+    pending_results: Set[asyncio.Task] = set()
+
     @staticmethod
-    async def safe_swap(
-        delay: int,
+    async def create_job(
         private_key: str,
-        rpc_url: str,
         amount: Optional[float] = None,
-    ):
-        async with semaphore:
-            module = RhinoSwapModule(
-                api_key=config.application_settings.rhino_api_key,
-                private_key=private_key,
-                rpc_url=rpc_url,
-            )
+        state: Optional[WalletState] = None,
+    ) -> SwapJob:
+        if state and time.monotonic() - state.fetched_at > Bot.MAX_STATE_AGE:
+            state.balance_wei = state.nonce = None
 
-            try:
-                if delay > 0:
-                    logger.info(f"Wallet: {module.depositor_address} | Waiting for {delay} seconds before starting..")
-                    await asyncio.sleep(delay)
+        address = state.address if state else await signer.derive_address(private_key)
+        module = RhinoSwapModule(
+            session=rhino_session,
+            configs=rhino_configs,
+            gas_oracle=gas_oracle,
+            gas_limits=gas_limits,
+            signer=signer,
+            retry_policy=retry_policy,
+            journal=journal,
+            nonces=nonces,
+            api_key=config.application_settings.rhino_api_key,
+            private_key=private_key,
+            address=address,
+            rpc=rpc_pool,
+            state=state,
+            max_deposit_wei=max_deposit_wei,
+        )
+        if state and state.nonce is not None:
+            nonces.seed(module.depositor_address, state.nonce)
+
+        logger.info(f"Wallet: {module.depositor_address} | Bridge all BNB (opBNB -> BSC)..")
+        return SwapJob(module=module, ctx=module.begin(amount), stage=RhinoSwapModule.STAGES[0])
+
+    @staticmethod
+    async def on_done(job: SwapJob) -> None:
+        status, result = job.module.result
+        nonces.forget(job.module.depositor_address)
+        task = asyncio.create_task(Bot.finalize(job.module, status, result, job.started))
+        Bot.pending_results.add(task)
+        task.add_done_callback(Bot.pending_results.discard)
+
+    @staticmethod
+    async def finalize(module: RhinoSwapModule, status: bool, result: str, started: float) -> None:
+        ctx = module.context
+        outcomes: List[TxOutcome] = []
+        if status and receipt_tracker:
+            logger.info(f"Wallet: {module.depositor_address} | Deposit sent, waiting for confirmation | TX: {result}")
+            outcomes = await asyncio.gather(*(receipt_tracker.wait(tx_hash) for tx_hash in ctx.tx_hashes))
+            for outcome in outcomes:
+                metrics.increment(f"tx_{outcome.status}")
+
+            failed = next((outcome for outcome in outcomes if outcome.status != "confirmed"), None)
+            if failed is None:
+                for outcome in outcomes:
+                    metrics.observe("confirmation_latency", outcome.latency)
+                    journal.record(module.depositor_address, "confirmed", tx_hash=outcome.tx_hash)
+                    if ctx.gas_key and outcome.gas_used:
+                        gas_limits.record_gas_used(ctx.gas_key, outcome.gas_used)
+            elif failed.status == "reverted":
+                status, result = False, f"Transaction reverted in block {failed.block_number}: {failed.tx_hash}"
+                journal.record(module.depositor_address, "reverted", tx_hash=failed.tx_hash, error=result)
+            else:
+                status, result = False, f"Transaction not confirmed within {receipt_tracker.timeout:.0f}s: {failed.tx_hash}"
+                journal.record(module.depositor_address, "timeout", tx_hash=failed.tx_hash, error=result)
 
-                logger.info(f"Wallet: {module.depositor_address} | Bridge all BNB (opBNB -> BSC)..")
-                status, result = await module.process_swap(amount)
+        bridged: List[BridgeOutcome] = []
+        if status and bridge_tracker and ctx.quotes:
+            quote_ids = ", ".join(quote.quote_id for quote in ctx.quotes)
+            logger.info(f"Wallet: {module.depositor_address} | Deposit confirmed, waiting for delivery on BSC | quoteId={quote_ids}")
+            bridged = await asyncio.gather(*(bridge_tracker.wait(quote.quote_id) for quote in ctx.quotes))
+            for outcome in bridged:
+                metrics.increment(f"bridge_{outcome.status}")
 
-                if status:
-                    tx_hash = result if result.startswith("0x") else f"0x{result}"
-                    tx = f"https://opbnbscan.com/tx/{tx_hash}"
-                    logger.success(f"Wallet: {module.depositor_address} | BNB bridged | TX: {tx}")
-                else:
-                    logger.error(f"Wallet: {module.depositor_address} | Failed to bridge BNB | Error: {result}")
+            failed = next((outcome for outcome in bridged if outcome.status != "executed"), None)
+            if failed is None:
+                metrics.observe("bridge_latency", time.monotonic() - started)
+                for outcome in bridged:
+                    journal.record(module.depositor_address, "bridged", quote_id=outcome.quote_id)
+            elif failed.status == "failed":
+                status, result = False, f"Rhino reported bridge {failed.state} for quoteId={failed.quote_id}"
+                journal.record(module.depositor_address, "bridge_failed", quote_id=failed.quote_id, error=result)
+            else:
+                status, result = False, f"Bridge not completed within {bridge_tracker.timeout:.0f}s for quoteId={failed.quote_id}"
 
-                await file_operations.export_result(module.depositor_address, status, "rhino_bridge")
+        if status:
+            txs = ", ".join(f"https://opbnbscan.com/tx/{tx_hash}" for tx_hash in ctx.tx_hashes)
+            logger.success(f"Wallet: {module.depositor_address} | BNB bridged | TX: {txs}")
+        else:
+            logger.error(f"Wallet: {module.depositor_address} | Failed to bridge BNB | Error: {result}")
+
+        metrics.increment("swaps_success" if status else "swaps_failed")
+        record = Bot.build_record(module, status, result, time.monotonic() - started)
+        if outcomes:
+            failed = next((outcome for outcome in outcomes if outcome.status != "confirmed"), None)
+            record.tx_status = failed.status if failed else "confirmed"
+            record.block_number = max((outcome.block_number or 0 for outcome in outcomes), default=0) or None
+            record.gas_used = sum(outcome.gas_used or 0 for outcome in outcomes) or None
+            record.confirm = max(outcome.latency for outcome in outcomes)
+        if bridged:
+            failed = next((outcome for outcome in bridged if outcome.status != "executed"), None)
+            record.bridge_status = failed.status if failed else "executed"
+            record.withdraw_tx_hash = ", ".join(outcome.withdraw_tx_hash for outcome in bridged if outcome.withdraw_tx_hash) or None
+            record.bridge = max(outcome.latency for outcome in bridged)
+
+        await file_operations.export_result(module.depositor_address, status, "rhino_bridge")
+        await file_operations.export_record(record, "rhino_bridge")
+
+    @staticmethod
+    def build_record(module: RhinoSwapModule, status: bool, result: str, total: float) -> SwapRecord:
+        ctx = module.context
+        quotes = ctx.quotes if ctx else []
+
+        def join(values: List[Optional[str]]) -> Optional[str]:
+            return ", ".join(value for value in values if value) or None
+
+        return SwapRecord(
+            address=module.depositor_address,
+            status=status,
+            tx_hash=join(ctx.tx_hashes) if ctx else None,
+            quote_id=join([quote.quote_id for quote in quotes]),
+            amount=ctx.amount_str or None if ctx else None,
+            pay_amount=join([quote.pay_amount for quote in quotes]),
+            receive_amount=join([quote.receive_amount for quote in quotes]),
+            error=None if status else result,
+            error_kind=module.error_kind.value if module.error_kind else None,
+            attempts=module.attempts,
+            durations=dict(module.stage_durations),
+            total=total,
+            finished_at=time.time(),
+        )
+
+    @staticmethod
+    async def prefetch_states(wallets: List[str]) -> Dict[str, WalletState]:
+        derived = await signer.derive_addresses(wallets)
+        addresses = {wallet: address for wallet, address in zip(wallets, derived) if address}
 
-            finally:
-                if module:
-                    await module.cleanup()
+        await wallet_states.prefetch(list(addresses.values()))
+        return {wallet: wallet_states.pop(address) for wallet, address in addresses.items()}
+
+    @staticmethod
+    async def filter_resumed(states: Dict[str, WalletState]) -> Dict[str, WalletState]:
+        records = await journal.load([state.address for state in states.values()])
+
+        signed = [record for record in records.values() if record.stage == "signed" and record.tx_hash]
+        results = await rpc_batch.call_many([("eth_getTransactionByHash", [record.tx_hash]) for record in signed])
+        for record, tx in zip(signed, results):
+            if isinstance(tx, dict):
+                journal.record(record.address, "sent", tx_hash=record.tx_hash)
+                record.stage = "sent"
+
+        in_flight = [record for record in records.values() if record.stage in RunJournal.IN_FLIGHT_STAGES and record.tx_hash]
+        receipts = await rpc_batch.call_many([("eth_getTransactionReceipt", [record.tx_hash]) for record in in_flight])
+        unmined = [record for record, receipt in zip(in_flight, receipts) if receipt is None]
+        known = await rpc_batch.call_many([("eth_getTransactionByHash", [record.tx_hash]) for record in unmined])
+        dropped = {record.address for record, tx in zip(unmined, known) if tx is None}
+
+        for record, receipt in zip(in_flight, receipts):
+            if isinstance(receipt, dict) and int(receipt.get("status") or "0x1", 16) == 1:
+                journal.record(record.address, "confirmed", tx_hash=record.tx_hash)
+                record.stage = "confirmed"
+            elif isinstance(receipt, dict):
+                journal.record(record.address, "reverted", tx_hash=record.tx_hash)
+                record.stage = "reverted"
+            elif record.address in dropped:
+                journal.record(record.address, "dropped", tx_hash=record.tx_hash)
+                record.stage = "dropped"
+
+        pending = {}
+        for wallet, state in states.items():
+            record = records.get(state.address)
+            if record and record.stage in RunJournal.COMPLETED_STAGES:
+                logger.info(f"Wallet: {state.address} | Already bridged in a previous run | TX: {record.tx_hash}")
+                metrics.increment("swaps_skipped")
+                continue
+            if record and record.stage in RunJournal.IN_FLIGHT_STAGES:
+                logger.warning(f"Wallet: {state.address} | Deposit from a previous run is still pending, not re-sending | TX: {record.tx_hash}")
+                metrics.increment("swaps_skipped")
+                continue
+
+            pending[wallet] = state
+
+        return pending
+
+    async def _produce(self, scheduler: StartScheduler) -> None:
+        try:
+            for batch in config.wallets.batched(config.web3_settings.rpc_batch_size):
+                states = await self.prefetch_states(batch)
+                if config.resume:
+                    resumed = await self.filter_resumed(states)
+                    batch = [wallet for wallet in batch if wallet in resumed or wallet not in states]
+
+                for wallet in batch:
+                    await scheduler.put((wallet, states.get(wallet)))
+        finally:
+            await scheduler.close()
+
+    async def _feed(self, scheduler: StartScheduler, pipeline: SwapPipeline) -> None:
+        while True:
+            item = await scheduler.get()
+            if item is None:
+                return
+
+            wallet, state = item
+            try:
+                job = await self.create_job(private_key=wallet, state=state)
+            except Exception as e:
+                address = state.address if state else "unknown"
+                logger.error(f"Wallet: {address} | Failed to start swap | Error: {e}")
+                metrics.increment("swaps_failed")
+                continue
+
+            await pipeline.submit(job)
 
     async def process_swaps(self):
-        tasks = []
-
-        logger.info(f"Preparing bridge tasks for {len(config.wallets)} wallets..")
-        for wallet in config.wallets:
-            delay = (
-                random.randint(
-                    config.attempts_and_delay_settings.delay_before_start.min,
-                    config.attempts_and_delay_settings.delay_before_start.max,
-                )
-                if config.attempts_and_delay_settings.delay_before_start.max > 0
-                else 0
-            )
+        settings = config.pipeline_settings
+        metrics.reset()
+        delay_settings = config.attempts_and_delay_settings
+        scheduler = StartScheduler(
+            capacity=max(settings.queue_size, self.MAX_PENDING_WALLETS),
+            delay_range=(delay_settings.delay_before_start.min, delay_settings.delay_before_start.max),
+            wallets_per_minute=delay_settings.wallets_per_minute,
+        )
+        pipeline = SwapPipeline(
+            [
+                StagePool("chain_read", ("prepare",), settings.chain_read_threads),
+                StagePool("api", ("quote", "commit"), concurrency.max_limit, limiter=concurrency),
+                StagePool("sign", ("sign",), sign_threads),
+                StagePool("broadcast", ("send",), settings.broadcast_threads),
+            ],
+            queue_size=settings.queue_size,
+            metrics=metrics,
+            on_done=self.on_done,
+        )
+
+        await journal.start(resume=config.resume)
+        await file_operations.start()
+        if config.resume:
+            logger.info("Resuming previous run, wallets completed in the journal will be skipped..")
 
-            tasks.append(
-                asyncio.create_task(
-                    self.safe_swap(
-                        delay=delay,
-                        private_key=wallet,
-                        rpc_url=config.web3_settings.opbnb_rpc_url,
-                    )
-                )
+        logger.info(
+            f"Starting pipeline for {len(config.wallets)} wallets | chain reads: {settings.chain_read_threads}, "
+            f"Rhino API: {concurrency.limit}-{concurrency.max_limit}, signing: {sign_threads}, "
+            f"broadcast: {settings.broadcast_threads}.."
+        )
+        try:
+            await pipeline.run(
+                lambda p: asyncio.gather(self._produce(scheduler), self._feed(scheduler, p))
             )
+            while self.pending_results:
+                await asyncio.gather(*self.pending_results)
+        finally:
+            await journal.close()
+            await file_operations.close()
 
-        logger.success(f"Prepared {len(tasks)} swap tasks. Starting execution..")
-        await asyncio.gather(*tasks)
+        logger.info(f"Run metrics | {metrics.summary()}")
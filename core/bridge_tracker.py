@@ -0,0 +1,126 @@
+import asyncio
+import heapq
+import time
+
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from core.rhino_session import RhinoApiError, RhinoApiSession
+from models import BridgeOutcome
+
+
+class BridgeStatusTracker:
+    EXECUTED_STATES = frozenset({"EXECUTED"})
+    FAILED_STATES = frozenset({"FAILED", "CANCELLED", "REJECTED", "REFUNDED"})
+
+    def __init__(
+        self,
+        session: RhinoApiSession,
+        api_key: str,
+        *,
+        poll_interval: float = 5.0,
+        backoff_max: float = 60.0,
+        timeout: float = 1800.0,
+        max_concurrency: int = 10,
+    ):
+        self.session = session
+        self.api_key = api_key
+        self.poll_interval = poll_interval
+        self.backoff_max = max(poll_interval, backoff_max)
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._started_at: Dict[str, float] = {}
+        self._delays: Dict[str, float] = {}
+        self._due: List[Tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
+        self._poller: Optional[asyncio.Task] = None
+
+    def track(self, quote_id: str) -> asyncio.Future:
+        future = self._pending.get(quote_id)
+        if future is None:
+            now = time.monotonic()
+            future = self._pending[quote_id] = asyncio.get_running_loop().create_future()
+            self._started_at[quote_id] = now
+            self._delays[quote_id] = self.poll_interval
+            heapq.heappush(self._due, (now + self.poll_interval, quote_id))
+            self._wakeup.set()
+
+        if not self._poller or self._poller.done():
+            self._poller = asyncio.create_task(self._poll())
+
+        return future
+
+    async def wait(self, quote_id: str) -> BridgeOutcome:
+        return await asyncio.shield(self.track(quote_id))
+
+    async def _poll(self) -> None:
+        while self._pending:
+            self._wakeup.clear()
+            delay = self._due[0][0] - time.monotonic() if self._due else self.poll_interval
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+            now = time.monotonic()
+            due = []
+            while self._due and self._due[0][0] <= now and len(due) < self.max_concurrency:
+                due.append(heapq.heappop(self._due)[1])
+
+            await asyncio.gather(*(self._check(quote_id) for quote_id in due if quote_id in self._pending))
+
+    async def _check(self, quote_id: str) -> None:
+        elapsed = time.monotonic() - self._started_at[quote_id]
+
+        try:
+            data = await self.session.request("GET", f"/bridge/history/bridge/{quote_id}", api_key=self.api_key)
+            state = str(data.get("state") or "").upper()
+        except RhinoApiError as e:
+            if e.status_code != 404:
+                logger.debug(f"Bridge status lookup failed for quoteId={quote_id} | Error: {e}")
+            data, state = {}, ""
+        except Exception as e:
+            logger.debug(f"Bridge status lookup failed for quoteId={quote_id} | Error: {e}")
+            data, state = {}, ""
+
+        if state in self.EXECUTED_STATES or state in self.FAILED_STATES:
+            self._resolve(quote_id, BridgeOutcome(
+                quote_id=quote_id,
+                status="executed" if state in self.EXECUTED_STATES else "failed",
+                state=state,
+                withdraw_tx_hash=data.get("withdrawTxHash"),
+                latency=elapsed,
+            ))
+            return
+
+        if elapsed >= self.timeout:
+            self._resolve(quote_id, BridgeOutcome(quote_id=quote_id, status="timeout", state=state or None, latency=elapsed))
+            return
+
+        delay = self._delays[quote_id] = min(self.backoff_max, self._delays[quote_id] * 1.5)
+        heapq.heappush(self._due, (time.monotonic() + delay, quote_id))
+
+    def _resolve(self, quote_id: str, outcome: BridgeOutcome) -> None:
+        self._started_at.pop(quote_id, None)
+        self._delays.pop(quote_id, None)
+        future = self._pending.pop(quote_id, None)
+        if future and not future.done():
+            future.set_result(outcome)
+
+    async def close(self) -> None:
+        if self._poller:
+            self._poller.cancel()
+            self._poller = None
+
+        for future in self._pending.values():
+            future.cancel()
+
+        self._pending.clear()
+        self._started_at.clear()
+        self._delays.clear()
+        self._due.clear()
@@ -0,0 +1,50 @@
+from typing import Optional
+
+from web3 import Web3
+
+DEPOSIT_NATIVE_SIGNATURE = "depositNativeWithId(uint256)"
+DEPOSIT_NATIVE_SELECTOR = "0x" + bytes(Web3.keccak(text=DEPOSIT_NATIVE_SIGNATURE)[:4]).hex()
+
+
+def encode_deposit_native(commitment_id: int) -> str:
+    return DEPOSIT_NATIVE_SELECTOR + commitment_id.to_bytes(32, "big").hex()
+
+
+def build_deposit_call(*, sender: str, bridge_address: str, commitment_id: int, value_wei: int) -> dict:
+    return {
+        "from": sender,
+        "to": bridge_address,
+        "value": value_wei,
+        "data": encode_deposit_native(commitment_id),
+    }
+
+
+def build_deposit_tx(
+    *,
+    bridge_address: str,
+    chain_id: int,
+    commitment_id: int,
+    value_wei: int,
+    nonce: int,
+    gas: int,
+    gas_price: Optional[int] = None,
+    max_fee_per_gas: Optional[int] = None,
+    max_priority_fee_per_gas: Optional[int] = None,
+) -> dict:
+    tx = {
+        "to": bridge_address,
+        "value": value_wei,
+        "data": encode_deposit_native(commitment_id),
+        "nonce": nonce,
+        "chainId": chain_id,
+        "gas": gas,
+    }
+
+    if max_fee_per_gas is not None:
+        tx["type"] = 2
+        tx["maxFeePerGas"] = max_fee_per_gas
+        tx["maxPriorityFeePerGas"] = max_priority_fee_per_gas or 0
+    else:
+        tx["gasPrice"] = gas_price
+
+    return tx
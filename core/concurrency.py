@@ -0,0 +1,102 @@
+import asyncio
+
+from typing import List, Optional
+
+from loguru import logger
+
+from utils import Metrics, percentile
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        *,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        metrics: Metrics,
+        window: int = 20,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.1,
+        decrease_factor: float = 0.7,
+        baseline_weight: float = 0.2,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial))
+        self.metrics = metrics
+        self.window = window
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.decrease_factor = decrease_factor
+        self.baseline_weight = baseline_weight
+
+        self.in_flight = 0
+        self._latencies: List[float] = []
+        self._errors = 0
+        self._baseline_p95: Optional[float] = None
+        self._cooldown = 0
+        self._saturated = False
+        self._condition = asyncio.Condition()
+
+        self._publish()
+
+    def _publish(self) -> None:
+        self.metrics.set_gauge("concurrency_limit", self.limit)
+        self.metrics.set_gauge("in_flight", self.in_flight)
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            self._saturated = self._saturated or self.in_flight >= self.limit
+            self._publish()
+
+    async def release(self, latency: float, *, ok: bool, overloaded: bool = False) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self.metrics.observe("swap_latency", latency)
+            self._cooldown = max(0, self._cooldown - 1)
+
+            if overloaded:
+                self._decrease("overload signal")
+            else:
+                self._latencies.append(latency)
+                self._errors += 0 if ok else 1
+                if len(self._latencies) >= self.window:
+                    self._evaluate()
+
+            self._publish()
+            self._condition.notify_all()
+
+    def _evaluate(self) -> None:
+        p95 = percentile(self._latencies, 95)
+        error_rate = self._errors / len(self._latencies)
+
+        saturated = self._saturated
+        self._latencies.clear()
+        self._errors = 0
+        self._saturated = False
+
+        baseline = self._baseline_p95 if self._baseline_p95 is not None else p95
+        self._baseline_p95 = baseline * (1 - self.baseline_weight) + p95 * self.baseline_weight
+
+        if error_rate > self.max_error_rate:
+            self._decrease(f"error rate {error_rate:.0%}")
+        elif p95 > baseline * self.latency_tolerance:
+            self._decrease(f"p95 latency {p95:.2f}s")
+        elif saturated and self.limit < self.max_limit:
+            self.limit += 1
+            logger.debug(f"Concurrency limit increased to {self.limit} (p95 latency {p95:.2f}s)")
+
+    def _decrease(self, reason: str) -> None:
+        self._latencies.clear()
+        self._errors = 0
+        if self._cooldown:
+            return
+
+        limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+        self._cooldown = self.limit
+        if limit < self.limit:
+            self.limit = limit
+            logger.warning(f"Concurrency limit decreased to {self.limit} ({reason})")
@@ -0,0 +1,53 @@
+import asyncio
+
+from enum import Enum
+
+import aiohttp
+import httpx
+
+from core.rhino_session import RhinoApiError
+
+
+class ErrorKind(Enum):
+    NETWORK = "network"
+    RATE_LIMITED = "rate_limited"
+    SERVER = "server"
+    NONCE_TOO_LOW = "nonce_too_low"
+    ALREADY_KNOWN = "already_known"
+    UNDERPRICED = "underpriced"
+    INSUFFICIENT_FUNDS = "insufficient_funds"
+    QUOTE_EXPIRED = "quote_expired"
+    FATAL = "fatal"
+
+    @property
+    def is_overload(self) -> bool:
+        return self in (ErrorKind.NETWORK, ErrorKind.RATE_LIMITED)
+
+
+MESSAGE_PATTERNS = (
+    ("nonce too low", ErrorKind.NONCE_TOO_LOW),
+    ("already known", ErrorKind.ALREADY_KNOWN),
+    ("known transaction", ErrorKind.ALREADY_KNOWN),
+    ("underpriced", ErrorKind.UNDERPRICED),
+    ("fee too low", ErrorKind.UNDERPRICED),
+    ("insufficient funds", ErrorKind.INSUFFICIENT_FUNDS),
+    ("expired", ErrorKind.QUOTE_EXPIRED),
+)
+
+
+def classify_error(error: BaseException) -> ErrorKind:
+    if isinstance(error, (httpx.TimeoutException, httpx.TransportError, aiohttp.ClientError, asyncio.TimeoutError)):
+        return ErrorKind.NETWORK
+
+    message = str(error).lower()
+    for pattern, kind in MESSAGE_PATTERNS:
+        if pattern in message:
+            return kind
+
+    if isinstance(error, RhinoApiError):
+        if error.status_code == 429:
+            return ErrorKind.RATE_LIMITED
+        if error.status_code >= 500:
+            return ErrorKind.SERVER
+
+    return ErrorKind.FATAL
@@ -0,0 +1,45 @@
+import asyncio
+
+from typing import Awaitable, Callable, Dict, Tuple
+
+from loguru import logger
+
+GasLimitKey = Tuple[int, str, str]
+
+
+class GasLimitCache:
+    def __init__(self, *, margin: float = 1.2):
+        self.margin = margin
+
+        self._limits: Dict[GasLimitKey, int] = {}
+        self._max_used: Dict[GasLimitKey, int] = {}
+        self._locks: Dict[GasLimitKey, asyncio.Lock] = {}
+
+    @staticmethod
+    def key(chain_id: int, contract_address: str, selector: str) -> GasLimitKey:
+        return int(chain_id), contract_address.lower(), selector.lower()
+
+    async def get(self, key: GasLimitKey, estimate: Callable[[], Awaitable[int]]) -> int:
+        limit = self._limits.get(key)
+        if limit:
+            return limit
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            limit = self._limits.get(key)
+            if limit:
+                return limit
+
+            estimated = await estimate()
+            limit = int(estimated * self.margin)
+            self._limits[key] = limit
+
+            logger.debug(f"Learned gas limit {limit} for {key[1]} ({key[2]}) from estimate {estimated}")
+            return limit
+
+    def record_gas_used(self, key: GasLimitKey, gas_used: int) -> None:
+        if gas_used <= self._max_used.get(key, 0):
+            return
+
+        self._max_used[key] = gas_used
+        self._limits[key] = int(gas_used * self.margin)
@@ -0,0 +1,146 @@
+import asyncio
+import statistics
+import time
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from eth_abi import encode
+from loguru import logger
+from web3 import Web3
+
+from core.rpc_pool import RpcEndpointPool
+
+L1_GAS_PRICE_ORACLE = Web3.to_checksum_address("0x420000000000000000000000000000000000000f")
+GET_L1_FEE_SELECTOR = bytes(Web3.keccak(text="getL1Fee(bytes)")[:4])
+
+
+@dataclass
+class FeeQuote:
+    max_fee_per_gas: int
+    max_priority_fee_per_gas: Optional[int] = None
+
+    @property
+    def is_eip1559(self) -> bool:
+        return self.max_priority_fee_per_gas is not None
+
+    def bumped(self, factor: float, cap: Optional[int] = None) -> "FeeQuote":
+        if factor == 1:
+            return self
+
+        max_fee = int(self.max_fee_per_gas * factor)
+        if cap and max_fee > cap:
+            max_fee = max(cap, self.max_fee_per_gas)
+
+        priority = self.max_priority_fee_per_gas
+        return FeeQuote(
+            max_fee_per_gas=max_fee,
+            max_priority_fee_per_gas=min(int(priority * factor), max_fee) if priority is not None else None,
+        )
+
+
+class GasPriceOracle:
+    FEE_HISTORY_BLOCKS = 20
+    CHEAP_PERCENTILE = 10
+    FAST_PERCENTILE = 90
+    L1_FEE_TTL = 30.0
+    STRATEGIES = ("cheapest", "fast", "fixed")
+
+    def __init__(
+        self,
+        rpc: RpcEndpointPool,
+        *,
+        ttl: float = 1.0,
+        percentile: int = 50,
+        max_gas_price_gwei: Optional[float] = None,
+        strategy: str = "cheapest",
+        eip1559: bool = True,
+    ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown fee strategy: {strategy}")
+        if strategy == "fixed" and not max_gas_price_gwei:
+            raise ValueError("Fee strategy 'fixed' requires max_gas_price_gwei")
+
+        self.rpc = rpc
+        self.ttl = ttl
+        self.percentile = percentile
+        self.max_gas_price_wei = Web3.to_wei(max_gas_price_gwei, "gwei") if max_gas_price_gwei else None
+        self.strategy = strategy
+        self.eip1559 = eip1559
+
+        self._lock = asyncio.Lock()
+        self._gas_price: Optional[int] = None
+        self._priority_fees: Dict[int, int] = {}
+        self._base_fee: Optional[int] = None
+        self._updated_at: float = 0
+        self._l1_fees: Dict[bytes, Tuple[int, float]] = {}
+
+    def _is_fresh(self) -> bool:
+        return self._gas_price is not None and time.monotonic() - self._updated_at < self.ttl
+
+    def _apply_cap(self, value: int) -> int:
+        if self.max_gas_price_wei and value > self.max_gas_price_wei:
+            return self.max_gas_price_wei
+        return value
+
+    async def _refresh(self) -> None:
+        gas_price = await self.rpc.read(lambda w3: w3.eth.gas_price)
+
+        percentiles = sorted({self.CHEAP_PERCENTILE, self.percentile, self.FAST_PERCENTILE})
+        try:
+            history = await self.rpc.read(lambda w3: w3.eth.fee_history(self.FEE_HISTORY_BLOCKS, "latest", percentiles))
+            blocks = [block for block in history["reward"] if block]
+            self._priority_fees = {
+                percentile: int(statistics.median(int(block[i]) for block in blocks)) if blocks else 0
+                for i, percentile in enumerate(percentiles)
+            }
+            self._base_fee = int(history["baseFeePerGas"][-1])
+        except Exception as e:
+            logger.debug(f"eth_feeHistory unavailable, using eth_gasPrice only: {e}")
+            self._priority_fees = {}
+            self._base_fee = None
+
+        if self.max_gas_price_wei and gas_price > self.max_gas_price_wei:
+            logger.warning(
+                f"Gas price {Web3.from_wei(gas_price, 'gwei')} gwei is above the cap, "
+                f"using {Web3.from_wei(self.max_gas_price_wei, 'gwei')} gwei"
+            )
+
+        self._gas_price = gas_price
+        self._updated_at = time.monotonic()
+
+    async def _ensure_fresh(self) -> None:
+        if self._is_fresh():
+            return
+
+        async with self._lock:
+            if not self._is_fresh():
+                await self._refresh()
+
+    async def l1_fee(self, data: bytes) -> int:
+        cached = self._l1_fees.get(data)
+        if cached and time.monotonic() - cached[1] < self.L1_FEE_TTL:
+            return cached[0]
+
+        call = {"to": L1_GAS_PRICE_ORACLE, "data": "0x" + (GET_L1_FEE_SELECTOR + encode(["bytes"], [data])).hex()}
+        fee = int.from_bytes(await self.rpc.read(lambda w3: w3.eth.call(call)), "big")
+        self._l1_fees[data] = (fee, time.monotonic())
+        return fee
+
+    async def suggest_fees(self) -> FeeQuote:
+        await self._ensure_fresh()
+        if not self.eip1559 or self._base_fee is None:
+            return FeeQuote(max_fee_per_gas=self._apply_cap(self._gas_price))
+
+        if self.strategy == "fast":
+            priority = self._priority_fees[self.FAST_PERCENTILE]
+            max_fee = 2 * self._base_fee + priority
+        elif self.strategy == "fixed":
+            priority = self._priority_fees[self.percentile]
+            max_fee = self.max_gas_price_wei
+        else:
+            priority = self._priority_fees[self.CHEAP_PERCENTILE]
+            max_fee = self._base_fee * 9 // 8 + priority
+
+        max_fee = self._apply_cap(max_fee)
+        return FeeQuote(max_fee_per_gas=max_fee, max_priority_fee_per_gas=min(priority, max_fee))
@@ -0,0 +1,161 @@
+import asyncio
+import sqlite3
+import time
+import uuid
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+from models import JournalRecord
+
+
+class RunJournal:
+    COMPLETED_STAGES = frozenset({"confirmed", "bridged"})
+    IN_FLIGHT_STAGES = frozenset({"sent", "timeout"})
+    LOAD_CHUNK_SIZE = 500
+
+    def __init__(self, path: Path, *, flush_interval: float = 0.5, flush_size: int = 200):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.run_id = ""
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple] = []
+        self._lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._conn:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL,
+                    address TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    quote_id TEXT,
+                    commitment_id TEXT,
+                    tx_hash TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS wallets (
+                    address TEXT PRIMARY KEY,
+                    run_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    quote_id TEXT,
+                    commitment_id TEXT,
+                    tx_hash TEXT,
+                    error TEXT,
+                    updated_at REAL NOT NULL
+                );
+                """
+            )
+
+        return self._conn
+
+    async def start(self, *, resume: bool) -> None:
+        self.run_id = uuid.uuid4().hex
+        await asyncio.to_thread(self._start, resume)
+        self._flusher = asyncio.create_task(self._flush_periodically())
+
+    def _start(self, resume: bool) -> None:
+        conn = self._connect()
+        if not resume:
+            with conn:
+                conn.execute("DELETE FROM wallets")
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush run journal: {e}")
+
+    def record(
+        self,
+        address: str,
+        stage: str,
+        *,
+        quote_id: Optional[str] = None,
+        commitment_id: Optional[str] = None,
+        tx_hash: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self._pending.append((self.run_id, address, stage, quote_id, commitment_id, tx_hash, error, time.time()))
+        if len(self._pending) >= self.flush_size:
+            task = asyncio.create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def record_durable(self, address: str, stage: str, **fields) -> None:
+        self.record(address, stage, **fields)
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                return
+
+            rows, self._pending = self._pending, []
+            await asyncio.to_thread(self._write, rows)
+
+    def _write(self, rows: Sequence[Tuple]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO events (run_id, address, stage, quote_id, commitment_id, tx_hash, error, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT INTO wallets (run_id, address, stage, quote_id, commitment_id, tx_hash, error, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(address) DO UPDATE SET "
+                "run_id = excluded.run_id, stage = excluded.stage, "
+                "quote_id = COALESCE(excluded.quote_id, wallets.quote_id), "
+                "commitment_id = COALESCE(excluded.commitment_id, wallets.commitment_id), "
+                "tx_hash = COALESCE(excluded.tx_hash, wallets.tx_hash), "
+                "error = excluded.error, updated_at = excluded.updated_at",
+                rows,
+            )
+
+    async def load(self, addresses: Sequence[str]) -> Dict[str, JournalRecord]:
+        async with self._lock:
+            return await asyncio.to_thread(self._load, list(addresses))
+
+    def _load(self, addresses: List[str]) -> Dict[str, JournalRecord]:
+        conn = self._connect()
+        records = {}
+
+        for i in range(0, len(addresses), self.LOAD_CHUNK_SIZE):
+            chunk = addresses[i:i + self.LOAD_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"SELECT address, stage, quote_id, commitment_id, tx_hash, error FROM wallets WHERE address IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            records.update({row[0]: JournalRecord(*row) for row in rows})
+
+        return records
+
+    async def close(self) -> None:
+        if self._flusher:
+            self._flusher.cancel()
+            self._flusher = None
+
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+
+        if self._conn:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,34 @@
+import asyncio
+
+from typing import Awaitable, Callable, Dict
+
+from loguru import logger
+
+
+class NonceManager:
+    def __init__(self, fetch_pending: Callable[[str], Awaitable[int]]):
+        self.fetch_pending = fetch_pending
+
+        self._next: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def seed(self, address: str, nonce: int) -> None:
+        self._next.setdefault(address, nonce)
+
+    async def reserve(self, address: str) -> int:
+        lock = self._locks.setdefault(address, asyncio.Lock())
+        async with lock:
+            nonce = self._next.get(address)
+            if nonce is None:
+                nonce = await self.fetch_pending(address)
+
+            self._next[address] = nonce + 1
+            return nonce
+
+    def resync(self, address: str) -> None:
+        if self._next.pop(address, None) is not None:
+            logger.debug(f"Wallet: {address} | Local nonce dropped, next reservation reads the pending nonce")
+
+    def forget(self, address: str) -> None:
+        self._next.pop(address, None)
+        self._locks.pop(address, None)
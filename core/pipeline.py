@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+from core.concurrency import AdaptiveLimiter
+from core.swap_module import RhinoSwapModule, SwapContext
+from utils import Metrics
+
+
+@dataclass
+class SwapJob:
+    module: RhinoSwapModule
+    ctx: SwapContext
+    stage: str
+    started: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class StagePool:
+    name: str
+    stages: Tuple[str, ...]
+    workers: int
+    limiter: Optional[AdaptiveLimiter] = None
+
+
+class SwapPipeline:
+    def __init__(
+        self,
+        pools: Sequence[StagePool],
+        *,
+        queue_size: int,
+        metrics: Metrics,
+        on_done: Callable[[SwapJob], Awaitable[None]],
+    ):
+        self.pools = list(pools)
+        self.metrics = metrics
+        self.on_done = on_done
+
+        self._queues: Dict[str, asyncio.Queue] = {pool.name: asyncio.Queue(maxsize=max(1, queue_size)) for pool in self.pools}
+        self._pool_of = {stage: pool for pool in self.pools for stage in pool.stages}
+        self._active = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._retries: Set[asyncio.Task] = set()
+
+    async def submit(self, job: SwapJob) -> None:
+        self._active += 1
+        self._idle.clear()
+        await self._route(job)
+
+    async def _route(self, job: SwapJob) -> None:
+        pool = self._pool_of[job.stage]
+        await self._queues[pool.name].put(job)
+        self.metrics.set_gauge(f"queue_{pool.name}", self._queues[pool.name].qsize())
+
+    async def _retry_later(self, job: SwapJob, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._route(job)
+
+    async def _finish(self, job: SwapJob) -> None:
+        try:
+            await self.on_done(job)
+        except Exception as e:
+            logger.error(f"Wallet: {job.module.depositor_address} | Failed to finalize swap | Error: {e}")
+        finally:
+            self._active -= 1
+            if not self._active:
+                self._idle.set()
+
+    async def _run_stages(self, pool: StagePool, job: SwapJob) -> Optional[str]:
+        stage = job.stage
+        while stage in pool.stages:
+            stage = await job.module.run_stage(job.ctx, stage)
+            if stage is None or job.module.last_error_kind:
+                break
+
+        return stage
+
+    async def _worker(self, pool: StagePool) -> None:
+        queue = self._queues[pool.name]
+        while True:
+            job = await queue.get()
+            self.metrics.set_gauge(f"queue_{pool.name}", queue.qsize())
+            if pool.limiter:
+                await pool.limiter.acquire()
+            started = time.monotonic()
+
+            stage = None
+            try:
+                stage = await self._run_stages(pool, job)
+            except Exception as e:
+                logger.error(f"Wallet: {job.module.depositor_address} | {pool.name} stage crashed | Error: {e}")
+                job.module.result = (False, f"{pool.name} stage crashed: {e}")
+            finally:
+                if pool.limiter:
+                    kind = job.module.last_error_kind
+                    await pool.limiter.release(
+                        time.monotonic() - started,
+                        ok=kind is None,
+                        overloaded=kind is not None and kind.is_overload,
+                    )
+
+            if stage is None:
+                await self._finish(job)
+            elif job.module.last_error_kind:
+                job.stage = stage
+                task = asyncio.create_task(self._retry_later(job, job.module.retry_delay))
+                self._retries.add(task)
+                task.add_done_callback(self._retries.discard)
+            else:
+                job.stage = stage
+                await self._route(job)
+
+    async def run(self, feed: Callable[["SwapPipeline"], Awaitable[None]]) -> None:
+        workers: List[asyncio.Task] = [
+            asyncio.create_task(self._worker(pool))
+            for pool in self.pools
+            for _ in range(max(1, pool.workers))
+        ]
+
+        try:
+            await feed(self)
+            await self._idle.wait()
+        finally:
+            for task in [*workers, *self._retries]:
+                task.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
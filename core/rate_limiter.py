@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+from typing import Dict, Optional
+
+from loguru import logger
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        recovery_step: float = 0.05,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.min_rate = min_rate or rate * 0.05
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step
+
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._tokens = min(self._tokens, 0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def reward(self) -> None:
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_step)
+
+
+class EndpointRateLimiter:
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30.0
+
+    def __init__(self, rates: Dict[str, float]):
+        self._buckets = {name: TokenBucket(rate) for name, rate in rates.items() if rate and rate > 0}
+        self._blocked_until: Dict[str, float] = {}
+        self._strikes: Dict[str, int] = {}
+
+    async def acquire(self, endpoint: str) -> None:
+        bucket = self._buckets.get(endpoint)
+        if bucket:
+            await bucket.acquire()
+            return
+
+        delay = self._blocked_until.get(endpoint, 0.0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, endpoint: str, retry_after: Optional[float] = None) -> None:
+        bucket = self._buckets.get(endpoint)
+        if bucket:
+            bucket.penalize(retry_after)
+            logger.warning(f"Rhino API rate limited on '{endpoint}', slowing down to {bucket.rate:.2f} req/s")
+            return
+
+        strikes = self._strikes[endpoint] = self._strikes.get(endpoint, 0) + 1
+        delay = retry_after if retry_after is not None else min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (strikes - 1))
+        self._blocked_until[endpoint] = max(self._blocked_until.get(endpoint, 0.0), time.monotonic() + delay)
+        logger.warning(f"Rhino API rate limited on '{endpoint}', backing off for {delay:.1f}s")
+
+    def reward(self, endpoint: str) -> None:
+        bucket = self._buckets.get(endpoint)
+        if bucket:
+            bucket.reward()
+        else:
+            self._strikes.pop(endpoint, None)
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from typing import Dict, Optional
+
+from loguru import logger
+
+from core.rpc_batch import JsonRpcBatchClient
+from models import TxOutcome
+
+
+class ReceiptTracker:
+    def __init__(
+        self,
+        rpc: JsonRpcBatchClient,
+        *,
+        confirmations: int = 1,
+        poll_interval: float = 1.0,
+        timeout: float = 120.0,
+    ):
+        self.rpc = rpc
+        self.confirmations = max(1, confirmations)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._submitted_at: Dict[str, float] = {}
+        self._poller: Optional[asyncio.Task] = None
+
+    def track(self, tx_hash: str) -> asyncio.Future:
+        future = self._pending.get(tx_hash)
+        if future is None:
+            future = self._pending[tx_hash] = asyncio.get_running_loop().create_future()
+            self._submitted_at[tx_hash] = time.monotonic()
+
+        if not self._poller or self._poller.done():
+            self._poller = asyncio.create_task(self._poll())
+
+        return future
+
+    async def wait(self, tx_hash: str) -> TxOutcome:
+        return await asyncio.shield(self.track(tx_hash))
+
+    async def _poll(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self._poll_once()
+            except Exception as e:
+                logger.warning(f"Receipt polling failed, retrying in {self.poll_interval}s | Error: {e}")
+                self._expire_overdue()
+
+    async def _poll_once(self) -> None:
+        hashes = list(self._pending)
+        results = await self.rpc.call_many(
+            [("eth_blockNumber", [])] + [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in hashes]
+        )
+
+        head = results[0]
+        if not isinstance(head, str):
+            raise RuntimeError(f"eth_blockNumber failed: {head}")
+        head = int(head, 16)
+
+        now = time.monotonic()
+        for tx_hash, receipt in zip(hashes, results[1:]):
+            elapsed = now - self._submitted_at[tx_hash]
+
+            if isinstance(receipt, dict) and receipt.get("blockNumber"):
+                block_number = int(receipt["blockNumber"], 16)
+                if head - block_number + 1 >= self.confirmations:
+                    self._resolve(tx_hash, TxOutcome(
+                        tx_hash=tx_hash,
+                        status="confirmed" if int(receipt.get("status") or "0x1", 16) == 1 else "reverted",
+                        block_number=block_number,
+                        gas_used=int(receipt["gasUsed"], 16) if receipt.get("gasUsed") else None,
+                        latency=elapsed,
+                    ))
+                    continue
+
+            if elapsed >= self.timeout:
+                self._resolve(tx_hash, TxOutcome(tx_hash=tx_hash, status="timeout", latency=elapsed))
+
+    def _expire_overdue(self) -> None:
+        now = time.monotonic()
+        for tx_hash, submitted_at in list(self._submitted_at.items()):
+            if now - submitted_at >= self.timeout:
+                self._resolve(tx_hash, TxOutcome(tx_hash=tx_hash, status="timeout", latency=now - submitted_at))
+
+    def _resolve(self, tx_hash: str, outcome: TxOutcome) -> None:
+        self._submitted_at.pop(tx_hash, None)
+        future = self._pending.pop(tx_hash, None)
+        if future and not future.done():
+            future.set_result(outcome)
+
+    async def close(self) -> None:
+        if self._poller:
+            self._poller.cancel()
+            self._poller = None
+
+        for future in self._pending.values():
+            future.cancel()
+
+        self._pending.clear()
+        self._submitted_at.clear()
@@ -0,0 +1,11 @@
+import random
+
+
+class RetryPolicy:
+    def __init__(self, *, max_attempts: int, backoff_base: float, backoff_max: float):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
@@ -0,0 +1,79 @@
+import asyncio
+import base64
+import json
+import time
+
+from dataclasses import dataclass
+from typing import Optional, Dict, TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from core.rhino_session import RhinoApiSession
+
+
+@dataclass
+class CachedToken:
+    token: str
+    expires_at: float
+
+
+class RhinoTokenCache:
+    DEFAULT_TTL = 600
+
+    def __init__(self, session: "RhinoApiSession", *, refresh_margin: float = 60):
+        self.session = session
+        self.refresh_margin = refresh_margin
+
+        self._tokens: Dict[str, CachedToken] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _decode_exp(token: str) -> Optional[float]:
+        raw = token.split(" ", 1)[-1]
+        parts = raw.split(".")
+        if len(parts) != 3:
+            return None
+
+        try:
+            payload = parts[1] + "=" * (-len(parts[1]) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            return float(claims["exp"])
+        except Exception:
+            return None
+
+    def _is_fresh(self, cached: Optional[CachedToken]) -> bool:
+        return cached is not None and cached.expires_at - self.refresh_margin > time.time()
+
+    async def get(self, api_key: str) -> str:
+        cached = self._tokens.get(api_key)
+        if self._is_fresh(cached):
+            return cached.token
+
+        lock = self._locks.setdefault(api_key, asyncio.Lock())
+        async with lock:
+            cached = self._tokens.get(api_key)
+            if self._is_fresh(cached):
+                return cached.token
+
+            cached = await self._fetch(api_key)
+            self._tokens[api_key] = cached
+            return cached.token
+
+    async def _fetch(self, api_key: str) -> CachedToken:
+        data = await self.session.request("POST", "/authentication/auth/apiKey", json_body={"apiKey": api_key})
+        jwt = data.get("token") or data.get("jwt") or data.get("accessToken") or data.get("authorization")
+        if not jwt:
+            raise RuntimeError(f"Can't find JWT in response: {data}")
+
+        expires_at = self._decode_exp(jwt)
+        if expires_at is None:
+            expires_at = time.time() + self.DEFAULT_TTL
+
+        logger.debug(f"Rhino JWT refreshed | Expires in {int(expires_at - time.time())} seconds")
+        return CachedToken(token=jwt, expires_at=expires_at)
+
+    def invalidate(self, api_key: str, token: str) -> None:
+        cached = self._tokens.get(api_key)
+        if cached and cached.token == token:
+            del self._tokens[api_key]
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import time
+
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from loguru import logger
+
+from core.rhino_session import RhinoApiSession
+from models import RhinoChainConfig
+
+
+class RhinoConfigsCache:
+    CONFIGS_PATH = "/bridge/configs"
+
+    def __init__(self, session: RhinoApiSession, *, cache_path: Optional[Path] = None, ttl: int = 0):
+        self.session = session
+        self.cache_path = cache_path
+        self.ttl = ttl
+
+        self._lock = asyncio.Lock()
+        self._configs: Optional[Dict[str, Any]] = None
+        self._chains: Dict[str, RhinoChainConfig] = {}
+        self._etag: Optional[str] = None
+        self._fetched_at: float = 0
+
+    def _read_disk(self) -> None:
+        if not self.cache_path or not self.cache_path.exists():
+            return
+
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            self._configs = cached["configs"]
+            self._etag = cached.get("etag")
+            self._fetched_at = float(cached.get("fetched_at", 0))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Rhino configs cache {self.cache_path}: {e}")
+            self._configs = None
+
+    def _write_disk(self) -> None:
+        if not self.cache_path:
+            return
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"fetched_at": self._fetched_at, "etag": self._etag, "configs": self._configs}),
+                encoding="utf-8",
+            )
+            tmp_path.replace(self.cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to persist Rhino configs cache {self.cache_path}: {e}")
+
+    def _is_fresh(self) -> bool:
+        if self._configs is None:
+            return False
+
+        return self.ttl <= 0 or time.time() - self._fetched_at < self.ttl
+
+    async def get(self) -> Dict[str, Any]:
+        if self._is_fresh():
+            return self._configs
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._configs
+
+            if self._configs is None and self.ttl > 0:
+                await asyncio.to_thread(self._read_disk)
+                if self._is_fresh():
+                    logger.debug(f"Loaded Rhino configs from {self.cache_path}")
+                    return self._configs
+
+            await self._refresh()
+            return self._configs
+
+    async def _refresh(self) -> None:
+        etag = self._etag if self._configs is not None else None
+        configs, etag = await self.session.get_revalidated(self.CONFIGS_PATH, etag=etag, hedge=True)
+
+        if configs is None:
+            logger.debug("Rhino configs not modified, reusing cached copy")
+        else:
+            self._configs = configs
+            self._chains.clear()
+
+        self._etag = etag
+        self._fetched_at = time.time()
+
+        if self.ttl > 0:
+            await asyncio.to_thread(self._write_disk)
+
+    async def get_chain(self, name: str) -> RhinoChainConfig:
+        configs = await self.get()
+
+        chain = self._chains.get(name)
+        if chain is None:
+            chain = RhinoChainConfig.from_configs(configs, name)
+            self._chains[name] = chain
+
+        return chain
@@ -0,0 +1,279 @@
+import asyncio
+import time
+import httpx
+
+from collections import defaultdict, deque
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+from core.rate_limiter import EndpointRateLimiter
+from core.rhino_auth import RhinoTokenCache
+from utils import Metrics, percentile
+
+T = TypeVar("T")
+
+API_BASE = "https://api.rhino.fi"
+
+
+class RhinoApiError(RuntimeError):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RhinoApiSession:
+    ENDPOINTS = (
+        ("/authentication/", "auth"),
+        ("/bridge/configs", "configs"),
+        ("/bridge/quote/commit/", "commit"),
+        ("/bridge/quote/", "quote"),
+        ("/bridge/history/", "history"),
+    )
+    MAX_RATE_LIMIT_RETRIES = 5
+    HEDGE_MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        *,
+        max_connections: int,
+        rate_limiter: Optional[EndpointRateLimiter] = None,
+        http2: bool = False,
+        timeout: float = 30,
+        keepalive_expiry: float = 30,
+        metrics: Optional[Metrics] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_budget: float = 0.1,
+    ):
+        self.max_connections = max(1, max_connections)
+        self.http2 = http2
+        self.timeout = timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.rate_limiter = rate_limiter or EndpointRateLimiter({})
+        self.metrics = metrics or Metrics()
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=200))
+        self._hedgeable_requests = 0
+        self._hedges = 0
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self.tokens = RhinoTokenCache(self)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if not self._client:
+            self._client = httpx.AsyncClient(
+                base_url=API_BASE,
+                timeout=self.timeout,
+                headers={"content-type": "application/json"},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=self._http2_available(),
+            )
+
+        return self._client
+
+    def _http2_available(self) -> bool:
+        if not self.http2:
+            return False
+
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("HTTP/2 requested for Rhino API but 'h2' is not installed, falling back to HTTP/1.1")
+            self.http2 = False
+
+        return self.http2
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: Optional[dict] = None,
+        api_key: Optional[str] = None,
+        hedge: bool = False,
+    ) -> dict:
+        if hedge:
+            return await self._hedged(self._endpoint(path), lambda sent: self._request(method, path, json_body, api_key, sent))
+
+        return await self._request(method, path, json_body, api_key)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[dict],
+        api_key: Optional[str],
+        sent: Optional[asyncio.Event] = None,
+    ) -> dict:
+        if not api_key:
+            return await self._send(method, path, json_body=json_body, sent=sent)
+
+        jwt = await self.tokens.get(api_key)
+        try:
+            return await self._send(method, path, json_body=json_body, jwt=jwt, sent=sent)
+        except RhinoApiError as e:
+            if e.status_code != 401:
+                raise
+
+            logger.debug(f"Rhino API returned 401 for {path}, refreshing JWT and retrying once")
+            self.tokens.invalidate(api_key, jwt)
+            jwt = await self.tokens.get(api_key)
+            return await self._send(method, path, json_body=json_body, jwt=jwt, sent=sent)
+
+    async def get_revalidated(
+        self,
+        path: str,
+        *,
+        etag: Optional[str] = None,
+        hedge: bool = False,
+    ) -> Tuple[Optional[dict], Optional[str]]:
+        headers = {"if-none-match": etag} if etag else {}
+
+        def send(sent: Optional[asyncio.Event] = None) -> Awaitable[httpx.Response]:
+            return self._execute("GET", path, headers=headers, sent=sent)
+
+        r = await (self._hedged(self._endpoint(path), send) if hedge else send())
+        if r.status_code == 304:
+            return None, etag
+
+        return self._parse_response(r, path), r.headers.get("etag")
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: Optional[dict] = None,
+        jwt: Optional[str] = None,
+        sent: Optional[asyncio.Event] = None,
+    ) -> dict:
+        headers = {}
+        if jwt:
+            headers["authorization"] = jwt
+
+        r = await self._execute(method, path, headers=headers, json_body=json_body, sent=sent)
+        return self._parse_response(r, path)
+
+    @classmethod
+    def _endpoint(cls, path: str) -> str:
+        for prefix, name in cls.ENDPOINTS:
+            if path.startswith(prefix):
+                return name
+        return "default"
+
+    @staticmethod
+    def _retry_after(r: httpx.Response) -> Optional[float]:
+        value = r.headers.get("retry-after")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    async def _execute(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict,
+        json_body: Optional[dict] = None,
+        sent: Optional[asyncio.Event] = None,
+    ) -> httpx.Response:
+        endpoint = self._endpoint(path)
+
+        for _ in range(self.MAX_RATE_LIMIT_RETRIES):
+            await self.rate_limiter.acquire(endpoint)
+            if sent:
+                sent.set()
+
+            started = time.monotonic()
+            r = await self.client.request(method, path, json=json_body, headers=headers)
+            if r.status_code != 429:
+                self.rate_limiter.reward(endpoint)
+                self._latencies[endpoint].append(time.monotonic() - started)
+                return r
+
+            self.rate_limiter.penalize(endpoint, self._retry_after(r))
+
+        return r
+
+    def _hedge_threshold(self, endpoint: str) -> Optional[float]:
+        latencies = self._latencies[endpoint]
+        if self.hedge_percentile is None or len(latencies) < self.HEDGE_MIN_SAMPLES:
+            return None
+
+        return percentile(latencies, self.hedge_percentile)
+
+    def _hedge_allowed(self) -> bool:
+        return self._hedges < self.hedge_budget * self._hedgeable_requests
+
+    async def _hedged(self, endpoint: str, send: Callable[[Optional[asyncio.Event]], Awaitable[T]]) -> T:
+        self._hedgeable_requests += 1
+        threshold = self._hedge_threshold(endpoint)
+        if threshold is None:
+            return await send(None)
+
+        sent = asyncio.Event()
+        primary = asyncio.create_task(send(sent))
+        pending = {primary}
+        waiter = asyncio.create_task(sent.wait())
+        try:
+            await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            done, _ = await asyncio.wait(pending, timeout=threshold)
+            if done or not self._hedge_allowed():
+                return await primary
+
+            self._hedges += 1
+            self.metrics.increment(f"rhino_hedged_{endpoint}")
+            logger.debug(f"Rhino {endpoint} request slower than {threshold:.2f}s, sending a hedged duplicate")
+
+            backup = asyncio.create_task(send(None))
+            pending.add(backup)
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.metrics.increment(f"rhino_hedge_wins_{endpoint}")
+                        return task.result()
+                    error = error or task.exception()
+
+            raise error
+        finally:
+            waiter.cancel()
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _parse_response(r: httpx.Response, path: str) -> dict:
+        try:
+            data = r.json()
+        except Exception:
+            raise RhinoApiError(f"Non-JSON response ({r.status_code}): {r.text[:300]}", r.status_code)
+
+        if r.status_code >= 400:
+            raise RhinoApiError(f"HTTP {r.status_code} {path}: {str(data)[:800]}", r.status_code)
+
+        return data
+
+    async def close(self) -> None:
+        if self._client:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,100 @@
+import asyncio
+import itertools
+import time
+
+import httpx
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from core.rpc_pool import RpcEndpointPool
+
+RpcCall = Tuple[str, list]
+
+
+class JsonRpcError(RuntimeError):
+    def __init__(self, message: str, code: Optional[int] = None):
+        super().__init__(message)
+        self.code = code
+
+
+class JsonRpcBatchClient:
+    def __init__(self, endpoints: RpcEndpointPool, *, batch_size: int = 100, max_connections: int = 5, timeout: float = 30):
+        self.endpoints = endpoints
+        self.batch_size = max(1, batch_size)
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+
+        self._ids = itertools.count(1)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if not self._client:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={"content-type": "application/json"},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+
+        return self._client
+
+    async def _send_batch(self, rpc_url: str, calls: Sequence[RpcCall]) -> List[Any]:
+        payload = [
+            {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params}
+            for method, params in calls
+        ]
+
+        r = await self.client.post(rpc_url, json=payload)
+        if r.status_code >= 400:
+            raise JsonRpcError(f"HTTP {r.status_code} from RPC batch: {r.text[:300]}")
+
+        data = r.json()
+        if not isinstance(data, list):
+            error = data.get("error") or {}
+            raise JsonRpcError(f"RPC batch rejected: {error.get('message', data)}", error.get("code"))
+
+        by_id = {item.get("id"): item for item in data}
+        results = []
+        for request in payload:
+            item = by_id.get(request["id"])
+            if item is None:
+                results.append(JsonRpcError(f"No response for {request['method']}"))
+            elif "error" in item:
+                error = item["error"] or {}
+                results.append(JsonRpcError(error.get("message", str(error)), error.get("code")))
+            else:
+                results.append(item.get("result"))
+
+        return results
+
+    async def call_many(self, calls: Sequence[RpcCall]) -> List[Any]:
+        semaphore = asyncio.Semaphore(self.max_connections)
+
+        async def _run(chunk: Sequence[RpcCall]) -> List[Any]:
+            async with semaphore:
+                error = None
+                for endpoint in self.endpoints.ranked():
+                    started = time.monotonic()
+                    try:
+                        results = await self._send_batch(endpoint.url, chunk)
+                    except (httpx.HTTPError, JsonRpcError, ValueError) as e:
+                        self.endpoints.record(endpoint, time.monotonic() - started, ok=False)
+                        error = e if isinstance(e, JsonRpcError) else JsonRpcError(str(e))
+                        continue
+
+                    self.endpoints.record(endpoint, time.monotonic() - started, ok=True)
+                    return results
+
+                return [error] * len(chunk)
+
+        chunks = [calls[i:i + self.batch_size] for i in range(0, len(calls), self.batch_size)]
+        results = await asyncio.gather(*(_run(chunk) for chunk in chunks))
+        return [item for chunk in results for item in chunk]
+
+    async def close(self) -> None:
+        if self._client:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,220 @@
+import asyncio
+import time
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Sequence, Set
+
+from loguru import logger
+from web3 import AsyncWeb3
+
+from core.errors import ErrorKind, classify_error
+from core.web3_pool import AsyncWeb3Pool
+from utils import Metrics, percentile
+
+RpcCall = Callable[[AsyncWeb3], Awaitable[Any]]
+
+
+@dataclass
+class RpcEndpoint:
+    url: str
+    latency: Optional[float] = None
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    failures: int = 0
+    block: int = 0
+    ejected_until: float = 0.0
+    lagging: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        return not self.lagging and self.ejected_until <= time.monotonic()
+
+    @property
+    def score(self) -> float:
+        return (self.latency if self.latency is not None else 0.0) * (1 + self.failures)
+
+    def p95(self) -> Optional[float]:
+        if len(self.samples) < 10:
+            return None
+
+        return percentile(self.samples, 95)
+
+
+class RpcEndpointPool:
+    ENDPOINT_ERRORS = (ErrorKind.NETWORK, ErrorKind.RATE_LIMITED, ErrorKind.SERVER)
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        web3_pool: AsyncWeb3Pool,
+        metrics: Metrics,
+        *,
+        hedge_reads: bool = True,
+        hedge_delay: float = 1.0,
+        broadcast_endpoints: int = 2,
+        max_block_lag: int = 5,
+        max_failures: int = 3,
+        eject_seconds: float = 30.0,
+        health_interval: float = 5.0,
+    ):
+        if not urls:
+            raise ValueError("At least one RPC endpoint is required")
+
+        self.endpoints = [RpcEndpoint(url) for url in dict.fromkeys(urls)]
+        self.web3_pool = web3_pool
+        self.metrics = metrics
+        self.hedge_reads = hedge_reads
+        self.hedge_delay = hedge_delay
+        self.broadcast_endpoints = max(1, broadcast_endpoints)
+        self.max_block_lag = max_block_lag
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self.health_interval = health_interval
+
+        self._monitor: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+
+    def ranked(self) -> List[RpcEndpoint]:
+        if len(self.endpoints) > 1 and (not self._monitor or self._monitor.done()):
+            self._monitor = asyncio.create_task(self._monitor_health())
+
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.healthy]
+        if not healthy:
+            return sorted(self.endpoints, key=lambda endpoint: (endpoint.ejected_until, endpoint.score))
+
+        return sorted(healthy, key=lambda endpoint: endpoint.score)
+
+    def record(self, endpoint: RpcEndpoint, latency: float, *, ok: bool) -> None:
+        if ok:
+            endpoint.failures = 0
+            endpoint.samples.append(latency)
+            endpoint.latency = latency if endpoint.latency is None else endpoint.latency * 0.8 + latency * 0.2
+            return
+
+        endpoint.failures += 1
+        if endpoint.failures >= self.max_failures and endpoint.healthy:
+            endpoint.ejected_until = time.monotonic() + self.eject_seconds
+            self.metrics.increment("rpc_ejections")
+            logger.warning(f"RPC {endpoint.url} failed {endpoint.failures} times in a row, ejected for {self.eject_seconds:.0f}s")
+
+    def is_endpoint_error(self, error: BaseException) -> bool:
+        return classify_error(error) in self.ENDPOINT_ERRORS
+
+    async def _call(self, endpoint: RpcEndpoint, call: RpcCall) -> Any:
+        w3 = await self.web3_pool.get(endpoint.url)
+        started = time.monotonic()
+        try:
+            result = await call(w3)
+        except Exception as e:
+            self.record(endpoint, time.monotonic() - started, ok=not self.is_endpoint_error(e))
+            raise
+
+        self.record(endpoint, time.monotonic() - started, ok=True)
+        return result
+
+    def _hedge_after(self, endpoint: RpcEndpoint) -> float:
+        p95 = endpoint.p95()
+        return min(5.0, max(0.05, p95)) if p95 is not None else self.hedge_delay
+
+    async def read(self, call: RpcCall) -> Any:
+        ranked = self.ranked()
+        pending: Set[asyncio.Task] = set()
+        launched = 0
+        hedged = False
+        last_error: Optional[BaseException] = None
+
+        def launch() -> None:
+            nonlocal launched
+            pending.add(asyncio.create_task(self._call(ranked[launched], call)))
+            launched += 1
+
+        launch()
+        try:
+            while pending:
+                can_hedge = self.hedge_reads and not hedged and launched < len(ranked)
+                timeout = self._hedge_after(ranked[0]) if can_hedge else None
+
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    self.metrics.increment("rpc_hedged_reads")
+                    launch()
+                    continue
+
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if not self.is_endpoint_error(error):
+                        raise error
+                    last_error = error
+
+                if not pending and launched < len(ranked):
+                    self.metrics.increment("rpc_failovers")
+                    launch()
+
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def broadcast(self, raw_tx: bytes) -> bytes:
+        targets = self.ranked()[:self.broadcast_endpoints]
+        tasks = [asyncio.create_task(self._call(endpoint, lambda w3: w3.eth.send_raw_transaction(raw_tx))) for endpoint in targets]
+
+        errors = []
+        for future in asyncio.as_completed(tasks):
+            try:
+                tx_hash = await future
+            except Exception as e:
+                errors.append(e)
+                continue
+
+            for task in tasks:
+                if not task.done():
+                    self._background.add(task)
+                    task.add_done_callback(self._discard_background)
+            return tx_hash
+
+        application_errors = [error for error in errors if not self.is_endpoint_error(error)]
+        raise (application_errors or errors)[0]
+
+    def _discard_background(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def _monitor_health(self) -> None:
+        while True:
+            results = await asyncio.gather(
+                *(self._call(endpoint, lambda w3: w3.eth.block_number) for endpoint in self.endpoints),
+                return_exceptions=True,
+            )
+
+            for endpoint, block in zip(self.endpoints, results):
+                if isinstance(block, int):
+                    endpoint.block = block
+
+            head = max(endpoint.block for endpoint in self.endpoints)
+            for endpoint, block in zip(self.endpoints, results):
+                lagging = not isinstance(block, int) or head - endpoint.block > self.max_block_lag
+                if lagging != endpoint.lagging:
+                    endpoint.lagging = lagging
+                    if lagging and not isinstance(block, int):
+                        logger.warning(f"RPC {endpoint.url} failed the health check, ejected | Error: {block}")
+                    elif lagging:
+                        logger.warning(f"RPC {endpoint.url} is {head - endpoint.block} blocks behind, ejected")
+                    else:
+                        logger.info(f"RPC {endpoint.url} caught up, back in rotation")
+
+            self.metrics.set_gauge("rpc_healthy_endpoints", sum(endpoint.healthy for endpoint in self.endpoints))
+            await asyncio.sleep(self.health_interval)
+
+    async def close(self) -> None:
+        if self._monitor:
+            self._monitor.cancel()
+            self._monitor = None
+
+        for task in self._background:
+            task.cancel()
+        self._background.clear()
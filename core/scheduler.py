@@ -0,0 +1,71 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+
+from typing import Any, List, Optional, Tuple
+
+
+class StartScheduler:
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        delay_range: Optional[Tuple[int, int]] = None,
+        wallets_per_minute: Optional[float] = None,
+    ):
+        self.capacity = max(1, capacity)
+        self.delay_range = delay_range
+        self.interval = 60 / wallets_per_minute if wallets_per_minute else 0
+
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._seq = itertools.count()
+        self._next_slot = 0.0
+        self._closed = False
+        self._condition = asyncio.Condition()
+
+    def _start_time(self) -> float:
+        now = time.monotonic()
+        start_at = now
+
+        if self.interval:
+            start_at = max(self._next_slot, now)
+            self._next_slot = start_at + self.interval
+
+        if self.delay_range and self.delay_range[1] > 0:
+            start_at += random.uniform(*self.delay_range)
+
+        return start_at
+
+    async def put(self, item: Any) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: len(self._heap) < self.capacity)
+            heapq.heappush(self._heap, (self._start_time(), next(self._seq), item))
+            self._condition.notify_all()
+
+    async def get(self) -> Optional[Any]:
+        async with self._condition:
+            while True:
+                if not self._heap:
+                    if self._closed:
+                        return None
+
+                    await self._condition.wait()
+                    continue
+
+                wait = self._heap[0][0] - time.monotonic()
+                if wait <= 0:
+                    _, _, item = heapq.heappop(self._heap)
+                    self._condition.notify_all()
+                    return item
+
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def close(self) -> None:
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
@@ -0,0 +1,83 @@
+import asyncio
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+from eth_account import Account
+
+
+def _derive_addresses(private_keys: Sequence[str]) -> List[Optional[str]]:
+    addresses = []
+    for private_key in private_keys:
+        try:
+            addresses.append(Account.from_key(private_key).address)
+        except Exception:
+            addresses.append(None)
+
+    return addresses
+
+
+def _sign_transaction(private_key: str, tx: dict) -> bytes:
+    return bytes(Account.sign_transaction(tx, private_key).raw_transaction)
+
+
+class TransactionSigner:
+    async def derive_addresses(self, private_keys: Sequence[str]) -> List[Optional[str]]:
+        return await asyncio.to_thread(_derive_addresses, private_keys)
+
+    async def derive_address(self, private_key: str) -> str:
+        address = (await asyncio.to_thread(_derive_addresses, [private_key]))[0]
+        if address is None:
+            raise ValueError("Invalid private key")
+
+        return address
+
+    async def sign(self, private_key: str, tx: dict) -> bytes:
+        return await asyncio.to_thread(_sign_transaction, private_key, tx)
+
+    async def close(self) -> None:
+        pass
+
+
+class ProcessPoolSigner(TransactionSigner):
+    def __init__(self, workers: Optional[int] = None, *, chunk_size: int = 256):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if not self._executor:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        return self._executor
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def derive_addresses(self, private_keys: Sequence[str]) -> List[Optional[str]]:
+        chunks = [private_keys[i:i + self.chunk_size] for i in range(0, len(private_keys), self.chunk_size)]
+        results = await asyncio.gather(*(self._run(_derive_addresses, chunk) for chunk in chunks))
+        return [address for chunk in results for address in chunk]
+
+    async def derive_address(self, private_key: str) -> str:
+        address = (await self._run(_derive_addresses, [private_key]))[0]
+        if address is None:
+            raise ValueError("Invalid private key")
+
+        return address
+
+    async def sign(self, private_key: str, tx: dict) -> bytes:
+        return await self._run(_sign_transaction, private_key, tx)
+
+    async def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def create_signer(backend: str, workers: Optional[int] = None) -> TransactionSigner:
+    if backend == "process":
+        return ProcessPoolSigner(workers)
+
+    return TransactionSigner()
@@ -1,98 +1,132 @@
-import asyncio
-import httpx
+import math
+import time
 
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional, Tuple, Dict, Any
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 from web3 import Web3
 
-from models import RhinoQuoteResult
-
-API_BASE = "https://api.rhino.fi"
-BRIDGE_ABI = [
-    {
-        "inputs": [{"internalType": "uint256", "name": "commitmentId", "type": "uint256"}],
-        "name": "depositNativeWithId",
-        "outputs": [],
-        "stateMutability": "payable",
-        "type": "function",
-    },
-]
+from core.bridge_tx import DEPOSIT_NATIVE_SELECTOR, build_deposit_call, build_deposit_tx, encode_deposit_native
+from core.errors import ErrorKind, classify_error
+from core.gas_limits import GasLimitCache, GasLimitKey
+from core.gas_oracle import FeeQuote, GasPriceOracle
+from core.journal import RunJournal
+from core.nonce_manager import NonceManager
+from core.rhino_configs import RhinoConfigsCache
+from core.retry import RetryPolicy
+from core.rhino_session import RhinoApiSession
+from core.rpc_pool import RpcEndpointPool
+from core.signer import TransactionSigner
+from models import RhinoQuoteResult, SwapRecord, WalletState
+
+
+@dataclass
+class DepositChunk:
+    amount_str: str
+    value_wei: int
+    quote: Optional[RhinoQuoteResult] = None
+    commitment_int: int = 0
+    nonce: Optional[int] = None
+    raw_tx: Optional[bytes] = None
+    tx_hash: str = ""
+
+
+@dataclass
+class SwapContext:
+    amount: Optional[float]
+    amount_str: str = ""
+    value_wei: int = 0
+    chain_id: int = 0
+    bridge_address: str = ""
+    gas_key: Optional[GasLimitKey] = None
+    gas_limit: int = 0
+    fee: Optional[FeeQuote] = None
+    chunks: List[DepositChunk] = field(default_factory=list)
+    gas_price_bump: float = 1.0
+
+    @property
+    def quotes(self) -> List[RhinoQuoteResult]:
+        return [chunk.quote for chunk in self.chunks if chunk.quote]
+
+    @property
+    def tx_hashes(self) -> List[str]:
+        return [chunk.tx_hash for chunk in self.chunks if chunk.tx_hash]
+
+    @property
+    def unsent(self) -> List[DepositChunk]:
+        return [chunk for chunk in self.chunks if not chunk.tx_hash]
 
 
 class RhinoSwapModule:
+    STAGES = SwapRecord.STAGES
     CHAIN_IN = "OPBNB"
     CHAIN_OUT = "BINANCE"
     TOKEN_IN = "BNB"
     TOKEN_OUT = "BNB"
+    CONSERVATIVE_GAS = 300_000
+    L1_TX_OVERHEAD = 128
 
     def __init__(
         self,
         *,
+        session: RhinoApiSession,
+        configs: RhinoConfigsCache,
+        gas_oracle: GasPriceOracle,
+        gas_limits: GasLimitCache,
+        signer: TransactionSigner,
+        retry_policy: RetryPolicy,
+        journal: RunJournal,
+        nonces: NonceManager,
         api_key: str,
         private_key: str,
-        rpc_url: str,
+        address: str,
+        rpc: RpcEndpointPool,
+        state: Optional[WalletState] = None,
+        max_deposit_wei: Optional[int] = None,
     ):
+        self.session = session
+        self.configs = configs
+        self.gas_oracle = gas_oracle
+        self.gas_limits = gas_limits
+        self.signer = signer
+        self.retry_policy = retry_policy
+        self.journal = journal
+        self.nonces = nonces
         self.api_key = api_key
         self.private_key = private_key
-        self.rpc_url = rpc_url
-
-        self._client: Optional[httpx.AsyncClient] = None
-        self._jwt: Optional[str] = None
-        self._configs: Optional[Dict[str, Any]] = None
-
-        self._w3 = Web3(Web3.HTTPProvider(self.rpc_url))
-        self._account = self._w3.eth.account.from_key(self.private_key)
-        self.depositor_address = Web3.to_checksum_address(self._account.address)
-        self.recipient_address = Web3.to_checksum_address(self._account.address)
-
-    async def cleanup(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
-
-    async def _http(self, method: str, path: str, *, json_body: Optional[dict] = None, jwt: Optional[str] = None) -> dict:
-        if not self._client:
-            self._client = httpx.AsyncClient(
-                base_url=API_BASE,
-                timeout=30,
-                headers={"content-type": "application/json"},
-            )
-
-        headers = {}
-        if jwt:
-            headers["authorization"] = jwt
-
-        r = await self._client.request(method, path, json=json_body, headers=headers)
-        try:
-            data = r.json()
-        except Exception:
-            raise RuntimeError(f"Non-JSON response ({r.status_code}): {r.text[:300]}")
-
-        if r.status_code >= 400:
-            raise RuntimeError(f"HTTP {r.status_code} {path}: {str(data)[:800]}")
-
-        return data
-
-    async def _get_jwt(self) -> str:
-        if self._jwt:
-            return self._jwt
-
-        data = await self._http("POST", "/authentication/auth/apiKey", json_body={"apiKey": self.api_key})
-        jwt = data.get("token") or data.get("jwt") or data.get("accessToken") or data.get("authorization")
-        if not jwt:
-            raise RuntimeError(f"Can't find JWT in response: {data}")
-
-        self._jwt = jwt
-        return jwt
-
-    async def _get_configs(self) -> Dict[str, Any]:
-        if self._configs:
-            return self._configs
 
-        self._configs = await self._http("GET", "/bridge/configs")
-        return self._configs
+        self.rpc = rpc
+        self._state = state
+        self.max_deposit_wei = max_deposit_wei
+        self.depositor_address = Web3.to_checksum_address(address)
+        self.recipient_address = Web3.to_checksum_address(address)
+        self.error_kind: Optional[ErrorKind] = None
+        self.context: Optional[SwapContext] = None
+        self.stage_durations: Dict[str, float] = {}
+        self.attempts = 0
+        self.last_error_kind: Optional[ErrorKind] = None
+        self.retry_delay = 0.0
+        self.result: Tuple[bool, str] = (False, "")
+        self._failures = 0
+
+    async def _http(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: Optional[dict] = None,
+        authorized: bool = False,
+        hedge: bool = False,
+    ) -> dict:
+        return await self.session.request(
+            method,
+            path,
+            json_body=json_body,
+            api_key=self.api_key if authorized else None,
+            hedge=hedge,
+        )
 
     @staticmethod
     def _quote_id_to_commitment_int(quote_id: str) -> int:
@@ -102,149 +136,295 @@ class RhinoSwapModule:
         return int(q, 16)
 
     async def _get_native_balance_wei(self) -> int:
-        return await asyncio.to_thread(lambda: self._w3.eth.get_balance(self._account.address))
+        if self._state and self._state.balance_wei is not None:
+            return self._state.balance_wei
 
-    async def _calc_max_send_wei(self, *, safety_mul: Decimal = Decimal("1.25")) -> int:
-        balance = await self._get_native_balance_wei()
-        gas_price = await asyncio.to_thread(lambda: self._w3.eth.gas_price)
+        return await self.rpc.read(lambda w3: w3.eth.get_balance(self.depositor_address))
 
-        conservative_gas = 300_000
-        fee_buffer = int(Decimal(gas_price * conservative_gas) * safety_mul)
+    async def _l1_fee_per_deposit(self) -> int:
+        data = bytes.fromhex(encode_deposit_native(2 ** 256 - 1)[2:]) + b"\xff" * self.L1_TX_OVERHEAD
+        return await self.gas_oracle.l1_fee(data) * 5 // 4
 
-        max_send = balance - fee_buffer
+    async def _calc_max_send_wei(self, ctx: SwapContext, *, deposits: int = 1) -> int:
+        balance = await self._get_native_balance_wei()
+        fee_per_deposit = ctx.gas_limit * ctx.fee.max_fee_per_gas + await self._l1_fee_per_deposit()
+        max_send = balance - fee_per_deposit * deposits
         return max_send if max_send > 0 else 0
 
-    async def _estimate_gas_native_deposit(self, bridge_contract, commitment_id_int: int, value_wei: int) -> int:
-        def _estimate() -> int:
-            tx = bridge_contract.functions.depositNativeWithId(commitment_id_int).build_transaction(
-                {"from": self._account.address, "value": value_wei}
+    async def _prepare_gas_limit(self, ctx: SwapContext) -> int:
+        try:
+            return await self.gas_limits.get(
+                ctx.gas_key,
+                lambda: self._estimate_gas_native_deposit(ctx.bridge_address, 1, 1),
             )
-            return self._w3.eth.estimate_gas(tx)
-
-        return int(await asyncio.to_thread(_estimate))
-
-    async def _send_native_deposit(
-        self,
-        *,
-        bridge_address: str,
-        chain_id: int,
-        commitment_id_int: int,
-        value_wei: int,
-    ) -> str:
-        bridge = self._w3.eth.contract(
-            address=Web3.to_checksum_address(bridge_address),
-            abi=BRIDGE_ABI,
+        except Exception as e:
+            logger.debug(f"Wallet: {self.depositor_address} | Gas estimate failed, reserving {self.CONSERVATIVE_GAS} gas | Error: {e}")
+            return self.CONSERVATIVE_GAS
+
+    def _deposit_count(self, value_wei: int) -> int:
+        if not self.max_deposit_wei or value_wei <= self.max_deposit_wei:
+            return 1
+        return math.ceil(value_wei / self.max_deposit_wei)
+
+    def _split_deposit(self, value_wei: int) -> List[DepositChunk]:
+        count = self._deposit_count(value_wei)
+        values = [value_wei // count] * count
+        values[-1] += value_wei - sum(values)
+
+        return [DepositChunk(amount_str=format(Web3.from_wei(value, "ether"), "f"), value_wei=value) for value in values]
+
+    async def _estimate_gas_native_deposit(self, bridge_address: str, commitment_id_int: int, value_wei: int) -> int:
+        call = build_deposit_call(
+            sender=self.depositor_address,
+            bridge_address=bridge_address,
+            commitment_id=commitment_id_int,
+            value_wei=value_wei,
         )
+        return int(await self.rpc.read(lambda w3: w3.eth.estimate_gas(call)))
 
-        gas_price = await asyncio.to_thread(lambda: self._w3.eth.gas_price)
+    async def _build_signed_deposit(self, ctx: SwapContext, chunk: DepositChunk) -> bytes:
+        fee = ctx.fee or (await self.gas_oracle.suggest_fees()).bumped(ctx.gas_price_bump, self.gas_oracle.max_gas_price_wei)
 
-        try:
-            gas_est = await self._estimate_gas_native_deposit(bridge, commitment_id_int, value_wei)
-            gas_limit = int(gas_est * 1.20)
-        except Exception as e:
-            gas_limit = 300_000
-
-        nonce = await asyncio.to_thread(lambda: self._w3.eth.get_transaction_count(self._account.address))
-
-        def _build_sign_send() -> str:
-            tx = bridge.functions.depositNativeWithId(commitment_id_int).build_transaction(
-                {
-                    "from": self._account.address,
-                    "value": value_wei,
-                    "nonce": nonce,
-                    "chainId": int(chain_id),
-                    "gas": gas_limit,
-                    "gasPrice": gas_price,
-                }
-            )
-            signed = self._account.sign_transaction(tx)
-            tx_hash = self._w3.eth.send_raw_transaction(signed.raw_transaction)
-            return tx_hash.hex()
-
-        return await asyncio.to_thread(_build_sign_send)
+        gas_limit = ctx.gas_limit
+        if not gas_limit:
+            try:
+                gas_limit = await self.gas_limits.get(
+                    ctx.gas_key,
+                    lambda: self._estimate_gas_native_deposit(ctx.bridge_address, chunk.commitment_int, chunk.value_wei),
+                )
+            except Exception:
+                gas_limit = self.CONSERVATIVE_GAS
+
+        if chunk.nonce is None:
+            chunk.nonce = await self.nonces.reserve(self.depositor_address)
+
+        tx = build_deposit_tx(
+            bridge_address=ctx.bridge_address,
+            chain_id=ctx.chain_id,
+            commitment_id=chunk.commitment_int,
+            value_wei=chunk.value_wei,
+            nonce=chunk.nonce,
+            gas=gas_limit,
+            gas_price=None if fee.is_eip1559 else fee.max_fee_per_gas,
+            max_fee_per_gas=fee.max_fee_per_gas if fee.is_eip1559 else None,
+            max_priority_fee_per_gas=fee.max_priority_fee_per_gas,
+        )
+        return await self.signer.sign(self.private_key, tx)
 
-    async def process_swap(self, amount: Optional[float]) -> Tuple[bool, str]:
+    async def _is_known_transaction(self, tx_hash: str) -> bool:
         try:
-            jwt = await self._get_jwt()
-            configs = await self._get_configs()
-
-            if self.CHAIN_IN not in configs:
-                available = ", ".join(sorted(configs.keys()))
-                raise RuntimeError(f"chainIn '{self.CHAIN_IN}' not found in configs. Available: {available}")
+            return await self.rpc.read(lambda w3: w3.eth.get_transaction(tx_hash)) is not None
+        except Exception:
+            return False
 
-            chain_cfg = configs[self.CHAIN_IN]
+    async def _stage_prepare(self, ctx: SwapContext) -> None:
+        chain_cfg = await self.configs.get_chain(self.CHAIN_IN)
 
-            chain_id = chain_cfg.get("chainId") or self._w3.eth.chain_id
-            bridge_address = chain_cfg.get("contractAddress")
-            native_token_name = chain_cfg.get("nativeTokenName")
+        ctx.chain_id = int(chain_cfg.chain_id or await self.rpc.read(lambda w3: w3.eth.chain_id))
+        ctx.bridge_address = chain_cfg.contract_address
+        native_token_name = chain_cfg.native_token_name
 
-            if not bridge_address:
-                raise RuntimeError(f"Missing contractAddress for chain '{self.CHAIN_IN}' in rhino configs")
+        if native_token_name and self.TOKEN_IN != native_token_name:
+            raise RuntimeError(
+                f"tokenIn '{self.TOKEN_IN}' != nativeTokenName '{native_token_name}' for chain '{self.CHAIN_IN}'. "
+                f"This module expects native deposit."
+            )
 
-            if native_token_name and self.TOKEN_IN != native_token_name:
-                raise RuntimeError(
-                    f"tokenIn '{self.TOKEN_IN}' != nativeTokenName '{native_token_name}' for chain '{self.CHAIN_IN}'. "
-                    f"This module expects native deposit."
-                )
+        ctx.gas_key = self.gas_limits.key(ctx.chain_id, ctx.bridge_address, DEPOSIT_NATIVE_SELECTOR)
+
+        ctx.fee = (await self.gas_oracle.suggest_fees()).bumped(ctx.gas_price_bump, self.gas_oracle.max_gas_price_wei)
+
+        if ctx.amount is None:
+            ctx.gas_limit = await self._prepare_gas_limit(ctx)
+            max_send_wei = await self._calc_max_send_wei(ctx)
+            deposits = self._deposit_count(max_send_wei)
+            if deposits > 1:
+                max_send_wei = await self._calc_max_send_wei(ctx, deposits=deposits)
+
+            if max_send_wei <= 0:
+                raise RuntimeError("Not enough balance to pay gas + amount (amount=None).")
+
+            amount_dec = Decimal(Web3.from_wei(max_send_wei, "ether"))
+            ctx.amount_str = format(amount_dec, "f")
+            logger.info(f"Wallet: {self.depositor_address} | Using MAX available: {ctx.amount_str} {self.TOKEN_IN}")
+        else:
+            if ctx.amount <= 0:
+                raise RuntimeError("Amount must be > 0 (or None for max balance).")
+            ctx.amount_str = f"{ctx.amount:.18f}".rstrip("0").rstrip(".")
+
+        ctx.value_wei = int(Web3.to_wei(Decimal(ctx.amount_str), "ether"))
+        ctx.chunks = self._split_deposit(ctx.value_wei)
+        if len(ctx.chunks) > 1:
+            logger.info(f"Wallet: {self.depositor_address} | Splitting {ctx.amount_str} {self.TOKEN_IN} into {len(ctx.chunks)} deposits")
+
+    async def _stage_quote(self, ctx: SwapContext) -> None:
+        for chunk in ctx.chunks:
+            if chunk.quote is None:
+                await self._quote_chunk(chunk)
+
+    async def _quote_chunk(self, chunk: DepositChunk) -> None:
+        quote_payload = {
+            "chainIn": self.CHAIN_IN,
+            "chainOut": self.CHAIN_OUT,
+            "amount": chunk.amount_str,
+            "mode": "pay",
+            "tokenIn": self.TOKEN_IN,
+            "tokenOut": self.TOKEN_OUT,
+            "depositor": self.depositor_address,
+            "recipient": self.recipient_address,
+            "amountNative": "0",
+            "isSda": "false",
+        }
+
+        quote = await self._http("POST", "/bridge/quote/bridge-swap/user", authorized=True, hedge=True, json_body=quote_payload)
+        quote_id = quote.get("quoteId")
+        if not quote_id:
+            raise RuntimeError(f"Quote has no quoteId: {quote}")
+
+        chunk.quote = RhinoQuoteResult(
+            quote_id=quote_id,
+            pay_amount=quote.get("payAmount"),
+            receive_amount=quote.get("receiveAmount"),
+            raw=quote,
+        )
 
-            if amount is None:
-                max_send_wei = await self._calc_max_send_wei()
-                if max_send_wei <= 0:
-                    raise RuntimeError("Not enough balance to pay gas + amount (amount=None).")
-
-                amount_dec = Decimal(self._w3.from_wei(max_send_wei, "ether"))
-                amount_str = format(amount_dec, "f")
-                logger.info(f"Wallet: {self.depositor_address} | Using MAX available: {amount_str} {self.TOKEN_IN}")
-            else:
-                if amount <= 0:
-                    raise RuntimeError("Amount must be > 0 (or None for max balance).")
-                amount_str = f"{amount:.18f}".rstrip("0").rstrip(".")
-
-            quote_payload = {
-                "chainIn": self.CHAIN_IN,
-                "chainOut": self.CHAIN_OUT,
-                "amount": amount_str,
-                "mode": "pay",
-                "tokenIn": self.TOKEN_IN,
-                "tokenOut": self.TOKEN_OUT,
-                "depositor": self.depositor_address,
-                "recipient": self.recipient_address,
-                "amountNative": "0",
-                "isSda": "false",
-            }
-
-            quote = await self._http("POST", "/bridge/quote/bridge-swap/user", jwt=jwt, json_body=quote_payload)
-            quote_id = quote.get("quoteId")
-            if not quote_id:
-                raise RuntimeError(f"Quote has no quoteId: {quote}")
-
-            q = RhinoQuoteResult(
-                quote_id=quote_id,
-                pay_amount=quote.get("payAmount"),
-                receive_amount=quote.get("receiveAmount"),
-                raw=quote,
-            )
+        self.journal.record(self.depositor_address, "quoted", quote_id=quote_id)
+        logger.info(
+            f"Wallet: {self.depositor_address} | Rhino quote: pay={chunk.quote.pay_amount} {self.TOKEN_IN} -> receive={chunk.quote.receive_amount} {self.TOKEN_OUT} | quoteId={chunk.quote.quote_id}"
+        )
 
-            logger.info(
-                f"Wallet: {self.depositor_address} | Rhino quote: pay={q.pay_amount} {self.TOKEN_IN} -> receive={q.receive_amount} {self.TOKEN_OUT} | quoteId={q.quote_id}"
-            )
+    async def _stage_commit(self, ctx: SwapContext) -> None:
+        for chunk in ctx.chunks:
+            if chunk.commitment_int:
+                continue
 
-            commit = await self._http("POST", f"/bridge/quote/commit/{q.quote_id}", jwt=jwt)
+            commit = await self._http("POST", f"/bridge/quote/commit/{chunk.quote.quote_id}", authorized=True)
             committed_id = commit.get("quoteId")
             if not committed_id:
                 raise RuntimeError(f"Commit failed: {commit}")
 
-            commitment_int = self._quote_id_to_commitment_int(committed_id)
+            chunk.commitment_int = self._quote_id_to_commitment_int(committed_id)
+            chunk.raw_tx = None
+            self.journal.record(self.depositor_address, "committed", quote_id=chunk.quote.quote_id, commitment_id=committed_id)
 
-            value_wei = self._w3.to_wei(Decimal(amount_str), "ether")
-            tx_hash = await self._send_native_deposit(
-                bridge_address=bridge_address,
-                chain_id=int(chain_id),
-                commitment_id_int=commitment_int,
-                value_wei=int(value_wei),
-            )
+    async def _stage_sign(self, ctx: SwapContext) -> None:
+        for chunk in ctx.unsent:
+            if chunk.raw_tx is None:
+                chunk.raw_tx = await self._build_signed_deposit(ctx, chunk)
 
-            return True, tx_hash
+    async def _stage_send(self, ctx: SwapContext) -> None:
+        for chunk in ctx.unsent:
+            await self._send_chunk(chunk, last=chunk is ctx.chunks[-1])
 
+    async def _send_chunk(self, chunk: DepositChunk, *, last: bool) -> None:
+        if chunk.raw_tx is None:
+            raise RuntimeError("Deposit transaction is not signed")
+
+        signed_stage, sent_stage = ("signed", "sent") if last else ("chunk_signed", "chunk_sent")
+        local_hash = "0x" + bytes(Web3.keccak(chunk.raw_tx)).hex()
+        await self.journal.record_durable(self.depositor_address, signed_stage, tx_hash=local_hash)
+        try:
+            tx_hash = await self.rpc.broadcast(chunk.raw_tx)
         except Exception as e:
-            return False, str(e)
+            kind = classify_error(e)
+            if kind == ErrorKind.ALREADY_KNOWN or (
+                kind == ErrorKind.NONCE_TOO_LOW and await self._is_known_transaction(local_hash)
+            ):
+                chunk.tx_hash = local_hash
+                self.journal.record(self.depositor_address, sent_stage, tx_hash=chunk.tx_hash)
+                return
+            raise
+
+        chunk.tx_hash = "0x" + bytes(tx_hash).hex()
+        self.journal.record(self.depositor_address, sent_stage, tx_hash=chunk.tx_hash)
+
+    def _resume_stage(self, stage: str, kind: ErrorKind, ctx: SwapContext) -> Optional[str]:
+        if kind in (ErrorKind.NETWORK, ErrorKind.RATE_LIMITED, ErrorKind.SERVER):
+            return stage
+
+        if kind == ErrorKind.QUOTE_EXPIRED:
+            for chunk in ctx.unsent:
+                chunk.quote, chunk.commitment_int, chunk.raw_tx = None, 0, None
+            return "quote"
+
+        if kind == ErrorKind.NONCE_TOO_LOW:
+            self.nonces.resync(self.depositor_address)
+            for chunk in ctx.unsent:
+                chunk.nonce, chunk.raw_tx = None, None
+            return "sign"
+
+        if kind == ErrorKind.UNDERPRICED:
+            cap = self.gas_oracle.max_gas_price_wei
+            if cap and ctx.fee and ctx.fee.max_fee_per_gas >= cap:
+                return None
+
+            ctx.gas_price_bump *= 1.15
+            if ctx.amount is None and not ctx.tx_hashes:
+                self.nonces.resync(self.depositor_address)
+                ctx.chunks = []
+                return "prepare"
+
+            ctx.fee = ctx.fee.bumped(1.15, cap) if ctx.fee else None
+            for chunk in ctx.unsent:
+                chunk.raw_tx = None
+            return "sign"
+
+        if kind == ErrorKind.INSUFFICIENT_FUNDS and ctx.amount is None and not ctx.tx_hashes:
+            if self._state:
+                self._state.balance_wei = None
+            self.nonces.resync(self.depositor_address)
+            ctx.chunks = []
+            return "prepare"
+
+        return None
+
+    def _track_stage(self, stage: str, started: float) -> None:
+        self.stage_durations[stage] = self.stage_durations.get(stage, 0.0) + time.monotonic() - started
+
+    def begin(self, amount: Optional[float]) -> SwapContext:
+        self.context = SwapContext(amount=amount)
+        self.error_kind = None
+        self.last_error_kind = None
+        self.stage_durations = {}
+        self.attempts = 1
+        self.retry_delay = 0.0
+        self.result = (False, "")
+        self._failures = 0
+        return self.context
+
+    async def run_stage(self, ctx: SwapContext, stage: str) -> Optional[str]:
+        started = time.monotonic()
+        self.last_error_kind = None
+        self.retry_delay = 0.0
+
+        try:
+            await getattr(self, f"_stage_{stage}")(ctx)
+        except Exception as e:
+            self._track_stage(stage, started)
+            kind = self.last_error_kind = classify_error(e)
+            self._failures += 1
+
+            resume = self._resume_stage(stage, kind, ctx)
+            if resume is None or self._failures >= self.retry_policy.max_attempts:
+                if any(chunk.nonce is not None for chunk in ctx.unsent):
+                    self.nonces.resync(self.depositor_address)
+                self.error_kind = kind
+                self.journal.record(self.depositor_address, "failed", error=f"{stage}: {e}")
+                self.result = (False, f"{stage} failed ({kind.value}): {e}")
+                return None
+
+            self.retry_delay = self.retry_policy.delay(self._failures)
+            self.attempts += 1
+            logger.warning(
+                f"Wallet: {self.depositor_address} | {stage} failed ({kind.value}), "
+                f"retrying from '{resume}' in {self.retry_delay:.1f}s | Error: {e}"
+            )
+            return resume
+
+        self._track_stage(stage, started)
+        index = self.STAGES.index(stage) + 1
+        if index < len(self.STAGES):
+            return self.STAGES[index]
+
+        self.result = (True, ", ".join(ctx.tx_hashes))
+        return None
@@ -0,0 +1,42 @@
+from typing import Dict, Optional, Sequence
+
+from loguru import logger
+
+from core.rpc_batch import JsonRpcBatchClient
+from models import WalletState
+
+
+class WalletStateTable:
+    def __init__(self, rpc: JsonRpcBatchClient):
+        self.rpc = rpc
+        self._states: Dict[str, WalletState] = {}
+
+    @staticmethod
+    def _to_int(value) -> Optional[int]:
+        return int(value, 16) if isinstance(value, str) else None
+
+    async def prefetch(self, addresses: Sequence[str]) -> None:
+        calls = []
+        for address in addresses:
+            calls.append(("eth_getBalance", [address, "latest"]))
+            calls.append(("eth_getTransactionCount", [address, "pending"]))
+
+        results = await self.rpc.call_many(calls)
+
+        failed = 0
+        for index, address in enumerate(addresses):
+            state = WalletState(
+                address=address,
+                balance_wei=self._to_int(results[2 * index]),
+                nonce=self._to_int(results[2 * index + 1]),
+            )
+            if state.balance_wei is None or state.nonce is None:
+                failed += 1
+
+            self._states[address] = state
+
+        if failed:
+            logger.warning(f"Prefetch incomplete for {failed} wallets, they will query the RPC directly")
+
+    def pop(self, address: str) -> Optional[WalletState]:
+        return self._states.pop(address, None)
@@ -0,0 +1,47 @@
+import asyncio
+
+import aiohttp
+
+from typing import Dict
+
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+
+class AsyncWeb3Pool:
+    def __init__(self, *, max_connections: int, timeout: float = 30):
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+
+        self._lock = asyncio.Lock()
+        self._instances: Dict[str, AsyncWeb3] = {}
+
+    async def get(self, rpc_url: str) -> AsyncWeb3:
+        w3 = self._instances.get(rpc_url)
+        if w3:
+            return w3
+
+        async with self._lock:
+            w3 = self._instances.get(rpc_url)
+            if w3:
+                return w3
+
+            provider = AsyncHTTPProvider(rpc_url)
+            await provider.cache_async_session(
+                aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=self.max_connections,
+                        limit_per_host=self.max_connections,
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                )
+            )
+
+            w3 = AsyncWeb3(provider)
+            self._instances[rpc_url] = w3
+            return w3
+
+    async def close(self) -> None:
+        for w3 in self._instances.values():
+            await w3.provider.disconnect()
+
+        self._instances.clear()
@@ -1,8 +1,114 @@
-import asyncio
+import os
 
-from utils import load_config, FileOperations
+from dataclasses import asdict
+from decimal import Decimal
+from pathlib import Path
+
+from web3 import Web3
+
+from core.concurrency import AdaptiveLimiter
+from core.bridge_tracker import BridgeStatusTracker
+from core.gas_limits import GasLimitCache
+from core.gas_oracle import GasPriceOracle
+from core.journal import RunJournal
+from core.nonce_manager import NonceManager
+from core.rate_limiter import EndpointRateLimiter
+from core.receipt_tracker import ReceiptTracker
+from core.retry import RetryPolicy
+from core.rhino_configs import RhinoConfigsCache
+from core.rhino_session import RhinoApiSession
+from core.rpc_batch import JsonRpcBatchClient
+from core.rpc_pool import RpcEndpointPool
+from core.signer import create_signer
+from core.wallet_state import WalletStateTable
+from core.web3_pool import AsyncWeb3Pool
+from utils import load_config, FileOperations, Metrics
 
 config = load_config()
-file_operations = FileOperations()
-semaphore = asyncio.Semaphore(config.application_settings.threads)
+file_operations = FileOperations(results_format=config.application_settings.results_format)
+metrics = Metrics()
+max_threads = config.concurrency_settings.max_threads or config.application_settings.threads * 4
+sign_threads = config.pipeline_settings.sign_threads or (
+    max(2, config.application_settings.signing_workers or os.cpu_count() or 1)
+    if config.application_settings.signing_backend == "process" else 2
+)
+rpc_connections = (
+    config.pipeline_settings.chain_read_threads
+    + sign_threads
+    + config.pipeline_settings.broadcast_threads
+)
+concurrency = AdaptiveLimiter(
+    initial=config.application_settings.threads,
+    min_limit=config.concurrency_settings.min_threads,
+    max_limit=max_threads,
+    metrics=metrics,
+)
 
+rhino_session = RhinoApiSession(
+    max_connections=max_threads,
+    rate_limiter=EndpointRateLimiter(asdict(config.rate_limit_settings)),
+    http2=config.application_settings.http2,
+    metrics=metrics,
+    hedge_percentile=config.application_settings.hedge_percentile,
+    hedge_budget=config.application_settings.hedge_budget,
+)
+rhino_configs = RhinoConfigsCache(
+    rhino_session,
+    cache_path=Path("cache") / "rhino_configs.json",
+    ttl=config.application_settings.configs_cache_ttl,
+)
+web3_pool = AsyncWeb3Pool(max_connections=rpc_connections)
+rpc_pool = RpcEndpointPool(
+    config.web3_settings.rpc_urls,
+    web3_pool,
+    metrics,
+    hedge_reads=config.web3_settings.hedge_reads,
+    broadcast_endpoints=config.web3_settings.broadcast_endpoints,
+    max_block_lag=config.web3_settings.max_block_lag,
+)
+rpc_batch = JsonRpcBatchClient(
+    rpc_pool,
+    batch_size=config.web3_settings.rpc_batch_size,
+    max_connections=rpc_connections,
+)
+wallet_states = WalletStateTable(rpc_batch)
+gas_oracle = GasPriceOracle(
+    rpc_pool,
+    ttl=config.web3_settings.gas_price_ttl,
+    percentile=config.web3_settings.gas_price_percentile,
+    max_gas_price_gwei=config.web3_settings.max_gas_price_gwei,
+    strategy=config.web3_settings.fee_strategy,
+    eip1559=config.web3_settings.eip1559,
+)
+gas_limits = GasLimitCache()
+signer = create_signer(
+    config.application_settings.signing_backend,
+    config.application_settings.signing_workers,
+)
+retry_policy = RetryPolicy(
+    max_attempts=config.attempts_and_delay_settings.max_attempts,
+    backoff_base=config.attempts_and_delay_settings.backoff_base,
+    backoff_max=config.attempts_and_delay_settings.backoff_max,
+)
+journal = RunJournal(file_operations.base_path / "journal.db")
+receipt_tracker = ReceiptTracker(
+    rpc_batch,
+    confirmations=config.web3_settings.confirmations,
+    poll_interval=config.web3_settings.receipt_poll_interval,
+    timeout=config.web3_settings.receipt_timeout,
+) if config.web3_settings.confirmations > 0 else None
+bridge_tracker = BridgeStatusTracker(
+    rhino_session,
+    config.application_settings.rhino_api_key,
+    poll_interval=config.bridge_status_settings.poll_interval,
+    backoff_max=config.bridge_status_settings.backoff_max,
+    timeout=config.bridge_status_settings.timeout,
+    max_concurrency=max_threads,
+) if config.bridge_status_settings.enabled else None
+nonces = NonceManager(
+    lambda address: rpc_pool.read(lambda w3: w3.eth.get_transaction_count(address, "pending"))
+)
+max_deposit_wei = (
+    int(Web3.to_wei(Decimal(str(config.application_settings.max_deposit_bnb)), "ether"))
+    if config.application_settings.max_deposit_bnb else None
+)
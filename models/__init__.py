@@ -1,2 +1,4 @@
 from .config import *
-from .rhino import RhinoQuoteResult
+from .rhino import RhinoQuoteResult, RhinoChainConfig
+from .wallet import WalletState, WalletSource, JournalRecord
+from .result import SwapRecord, TxOutcome, BridgeOutcome
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from typing import List, Literal, Optional, Union
 from pydantic import BaseModel, PositiveInt, ConfigDict, Field
 
+from .wallet import WalletSource
+
 
 class BaseConfig(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -16,26 +19,90 @@ class PositiveIntRange:
 @dataclass
 class AttemptsAndDelaySettings:
     delay_before_start: PositiveIntRange
+    wallets_per_minute: Optional[float] = None
+    max_attempts: PositiveInt = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
 
 
 
 @dataclass
 class Web3Settings:
-    opbnb_rpc_url: str
+    opbnb_rpc_url: Union[str, List[str]]
+    rpc_batch_size: int = 100
+    gas_price_ttl: float = 1.0
+    gas_price_percentile: int = 50
+    max_gas_price_gwei: Optional[float] = None
+    fee_strategy: Literal["cheapest", "fast", "fixed"] = "cheapest"
+    eip1559: bool = True
+    confirmations: int = 1
+    receipt_poll_interval: float = 1.0
+    receipt_timeout: float = 120.0
+    hedge_reads: bool = True
+    broadcast_endpoints: PositiveInt = 2
+    max_block_lag: int = 5
+
+    @property
+    def rpc_urls(self) -> List[str]:
+        return [self.opbnb_rpc_url] if isinstance(self.opbnb_rpc_url, str) else list(self.opbnb_rpc_url)
+
+
+@dataclass
+class ConcurrencySettings:
+    min_threads: PositiveInt = 1
+    max_threads: Optional[PositiveInt] = None
+
+
+@dataclass
+class PipelineSettings:
+    chain_read_threads: PositiveInt = 10
+    sign_threads: Optional[PositiveInt] = None
+    broadcast_threads: PositiveInt = 10
+    queue_size: PositiveInt = 100
+
+
+@dataclass
+class RateLimitSettings:
+    auth: float = 1
+    configs: float = 2
+    quote: float = 10
+    commit: float = 10
+    history: float = 5
+
+
+@dataclass
+class BridgeStatusSettings:
+    enabled: bool = True
+    poll_interval: float = 5.0
+    backoff_max: float = 60.0
+    timeout: float = 1800.0
 
 
 @dataclass
 class ApplicationSettings:
     threads: int
     rhino_api_key: str
+    http2: bool = False
+    hedge_percentile: Optional[float] = 95
+    hedge_budget: float = 0.1
+    configs_cache_ttl: int = 3600
+    signing_backend: Literal["thread", "process"] = "thread"
+    signing_workers: Optional[int] = None
+    results_format: Literal["jsonl", "csv"] = "jsonl"
+    max_deposit_bnb: Optional[float] = None
 
 
 
 class Config(BaseConfig):
-    wallets: list[str] = Field(default_factory=list)
+    wallets: WalletSource
 
     application_settings: ApplicationSettings
     web3_settings: Web3Settings
     attempts_and_delay_settings: AttemptsAndDelaySettings
+    rate_limit_settings: RateLimitSettings = Field(default_factory=RateLimitSettings)
+    concurrency_settings: ConcurrencySettings = Field(default_factory=ConcurrencySettings)
+    pipeline_settings: PipelineSettings = Field(default_factory=PipelineSettings)
+    bridge_status_settings: BridgeStatusSettings = Field(default_factory=BridgeStatusSettings)
 
     module: str = ""
+    resume: bool = False
@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class TxOutcome:
+    tx_hash: str
+    status: str
+    block_number: Optional[int] = None
+    gas_used: Optional[int] = None
+    latency: float = 0.0
+
+
+@dataclass
+class BridgeOutcome:
+    quote_id: str
+    status: str
+    state: Optional[str] = None
+    withdraw_tx_hash: Optional[str] = None
+    latency: float = 0.0
+
+
+@dataclass
+class SwapRecord:
+    STAGES = ("prepare", "quote", "commit", "sign", "send")
+    FIELDS = (
+        "address", "status", "tx_hash", "quote_id", "amount", "pay_amount", "receive_amount",
+        "tx_status", "block_number", "gas_used", "bridge_status", "withdraw_tx_hash", "error", "error_kind",
+        "attempts", *(f"{stage}_s" for stage in STAGES), "confirm_s", "bridge_s", "total_s", "finished_at",
+    )
+
+    address: str
+    status: bool
+    tx_hash: Optional[str] = None
+    quote_id: Optional[str] = None
+    amount: Optional[str] = None
+    pay_amount: Optional[str] = None
+    receive_amount: Optional[str] = None
+    tx_status: Optional[str] = None
+    block_number: Optional[int] = None
+    gas_used: Optional[int] = None
+    bridge_status: Optional[str] = None
+    withdraw_tx_hash: Optional[str] = None
+    error: Optional[str] = None
+    error_kind: Optional[str] = None
+    attempts: int = 0
+    durations: Dict[str, float] = field(default_factory=dict)
+    confirm: Optional[float] = None
+    bridge: Optional[float] = None
+    total: float = 0.0
+    finished_at: float = 0.0
+
+    def to_row(self) -> Dict[str, Any]:
+        row = {
+            "address": self.address,
+            "status": "success" if self.status else "failed",
+            "tx_hash": self.tx_hash,
+            "quote_id": self.quote_id,
+            "amount": self.amount,
+            "pay_amount": self.pay_amount,
+            "receive_amount": self.receive_amount,
+            "tx_status": self.tx_status,
+            "block_number": self.block_number,
+            "gas_used": self.gas_used,
+            "bridge_status": self.bridge_status,
+            "withdraw_tx_hash": self.withdraw_tx_hash,
+            "error": self.error,
+            "error_kind": self.error_kind,
+            "attempts": self.attempts,
+        }
+        for stage in self.STAGES:
+            duration = self.durations.get(stage)
+            row[f"{stage}_s"] = round(duration, 3) if duration is not None else None
+
+        row["confirm_s"] = round(self.confirm, 3) if self.confirm is not None else None
+        row["bridge_s"] = round(self.bridge, 3) if self.bridge is not None else None
+        row["total_s"] = round(self.total, 3)
+        row["finished_at"] = round(self.finished_at, 3)
+        return row
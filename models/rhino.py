@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional, Any, Dict
 
+from web3 import Web3
+
 
 @dataclass
 class RhinoQuoteResult:
@@ -8,3 +10,30 @@ class RhinoQuoteResult:
     pay_amount: Optional[str] = None
     receive_amount: Optional[str] = None
     raw: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class RhinoChainConfig:
+    name: str
+    contract_address: str
+    chain_id: Optional[int] = None
+    native_token_name: Optional[str] = None
+
+    @classmethod
+    def from_configs(cls, configs: Dict[str, Any], name: str) -> "RhinoChainConfig":
+        if name not in configs:
+            available = ", ".join(sorted(configs.keys()))
+            raise RuntimeError(f"chainIn '{name}' not found in configs. Available: {available}")
+
+        chain_cfg = configs[name]
+        contract_address = chain_cfg.get("contractAddress")
+        if not contract_address:
+            raise RuntimeError(f"Missing contractAddress for chain '{name}' in rhino configs")
+
+        chain_id = chain_cfg.get("chainId")
+        return cls(
+            name=name,
+            contract_address=Web3.to_checksum_address(contract_address),
+            chain_id=int(chain_id) if chain_id else None,
+            native_token_name=chain_cfg.get("nativeTokenName"),
+        )
@@ -0,0 +1,49 @@
+import time
+
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+
+@dataclass
+class WalletState:
+    address: str
+    balance_wei: Optional[int] = None
+    nonce: Optional[int] = None
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+class WalletSource:
+    def __init__(self, path: Path):
+        self.path = path
+        self._count: Optional[int] = None
+
+    def __iter__(self) -> Iterator[str]:
+        with self.path.open("r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield line
+
+    def __len__(self) -> int:
+        if self._count is None:
+            with self.path.open("rb") as file:
+                self._count = sum(1 for line in file if line.strip())
+
+        return self._count
+
+    def batched(self, size: int) -> Iterator[List[str]]:
+        iterator = iter(self)
+        while batch := list(islice(iterator, size)):
+            yield batch
+
+
+@dataclass
+class JournalRecord:
+    address: str
+    stage: str
+    quote_id: Optional[str] = None
+    commitment_id: Optional[str] = None
+    tx_hash: Optional[str] = None
+    error: Optional[str] = None
@@ -5,6 +5,7 @@ import warnings
 
 from loguru import logger
 from application import ApplicationManager
+from loader import config
 from utils import setup_logs
 
 
@@ -12,6 +13,7 @@ warnings.filterwarnings("ignore")
 
 
 async def main():
+    config.resume = "--resume" in sys.argv[1:]
     app = ApplicationManager()
 
     try:
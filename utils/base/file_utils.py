@@ -1,22 +1,47 @@
 import asyncio
-import aiofiles
+import csv
+import io
+import json
+import os
 
 from pathlib import Path
+from typing import IO, Dict, List, Optional, Tuple
 from loguru import logger
 
+from models import SwapRecord
 
 
 class FileOperations:
-    def __init__(self, base_path: str = "./results"):
+    def __init__(
+        self,
+        base_path: str = "./results",
+        *,
+        results_format: str = "jsonl",
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+    ):
+        if results_format not in ("jsonl", "csv"):
+            raise ValueError(f"Unknown results format: {results_format}")
+
         self.base_path = Path(base_path)
-        self.lock = asyncio.Lock()
+        self.results_format = results_format
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
         self.module_paths: dict[str, dict[str, Path]] = {
             "rhino_bridge": {
                 "success": self.base_path / "login" / "rhino_bridge_success.txt",
                 "failed": self.base_path / "login" / "rhino_bridge_failed.txt",
+                "records": self.base_path / "login" / f"rhino_bridge_results.{results_format}",
             },
         }
 
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._files: Dict[Path, IO[str]] = {}
+        self._headers: Dict[Path, str] = {}
+        self._csv_buffer = io.StringIO()
+        self._csv_writer = csv.writer(self._csv_buffer, lineterminator="\n")
+
     async def setup_files(self):
         self.base_path.mkdir(exist_ok=True)
         for module_name, module_paths in self.module_paths.items():
@@ -27,17 +52,107 @@ class FileOperations:
                 else:
                     path.touch(exist_ok=True)
 
+    async def start(self):
+        if self._writer:
+            return
+
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._run_writer())
+
     async def export_result(self, result: str, status: bool, module: str):
         if module not in self.module_paths:
             raise ValueError(f"Unknown module: {module}")
 
         file_path = self.module_paths[module]["success" if status else "failed"]
-        async with self.lock:
+        if not self._queue:
+            await self.start()
+
+        self._queue.put_nowait((file_path, f"{result}\n"))
+
+    async def export_record(self, record: SwapRecord, module: str):
+        if module not in self.module_paths:
+            raise ValueError(f"Unknown module: {module}")
+
+        file_path = self.module_paths[module]["records"]
+        if not self._queue:
+            await self.start()
+
+        row = record.to_row()
+        if self.results_format == "csv":
+            self._headers.setdefault(file_path, self._encode_csv(SwapRecord.FIELDS))
+            line = self._encode_csv(row.get(name) for name in SwapRecord.FIELDS)
+        else:
+            line = json.dumps(row, separators=(",", ":")) + "\n"
+
+        self._queue.put_nowait((file_path, line))
+
+    def _encode_csv(self, values) -> str:
+        self._csv_writer.writerow(values)
+        line = self._csv_buffer.getvalue()
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+        return line
+
+    async def _run_writer(self):
+        loop = asyncio.get_running_loop()
+        stopped = False
+
+        while not stopped:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            batch: List[Tuple[Path, str]] = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+
+                if item is None:
+                    stopped = True
+                    break
+                batch.append(item)
+
+            await asyncio.to_thread(self._write_batch, batch)
+
+    def _write_batch(self, batch: List[Tuple[Path, str]]):
+        lines: Dict[Path, List[str]] = {}
+        for path, line in batch:
+            lines.setdefault(path, []).append(line)
+
+        for path, path_lines in lines.items():
             try:
-                async with aiofiles.open(file_path, "a") as file:
-                    await file.write(f"{result}\n")
+                file = self._files.get(path)
+                if file is None:
+                    file = self._files[path] = path.open("a", encoding="utf-8", newline="")
+                    if path in self._headers and file.tell() == 0:
+                        file.write(self._headers[path])
+
+                file.write("".join(path_lines))
+                file.flush()
             except IOError as e:
                 logger.error(f"Error writing to file (IOError): {e}")
             except Exception as e:
                 logger.error(f"Error writing to file: {e}")
 
+    def _close_files(self):
+        for file in self._files.values():
+            try:
+                file.flush()
+                os.fsync(file.fileno())
+                file.close()
+            except Exception as e:
+                logger.error(f"Error closing result file: {e}")
+
+        self._files.clear()
+
+    async def close(self):
+        if self._writer:
+            self._queue.put_nowait(None)
+            await self._writer
+            self._writer = None
+            self._queue = None
+
+        await asyncio.to_thread(self._close_files)
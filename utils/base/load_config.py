@@ -2,10 +2,10 @@ import os
 import yaml
 
 from pathlib import Path
-from typing import Dict, List, Generator, Union
+from typing import Dict, List, Union
 
 from loguru import logger
-from models import Config
+from models import Config, WalletSource
 from sys import exit
 
 
@@ -60,24 +60,15 @@ class ConfigLoader:
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML format: {e}")
 
-    def _parse_accounts(
-            self,
-            filename: str,
-    ) -> Generator[str, None, None]:
-        try:
-            lines = self._read_file(self.data_path / filename, allow_empty=False)
-
-            for line in lines:
-                try:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    yield line
+    def _load_wallets(self, filename: str) -> WalletSource:
+        file_path = self.data_path / filename
+        if not file_path.exists():
+            raise ConfigurationError(f"File not found: {file_path}")
 
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Invalid account format: {line} | File: {filename} | Error: {e}")
-                    exit(1)
+        source = WalletSource(file_path)
+        try:
+            if next(iter(source), None) is None:
+                raise ConfigurationError(f"File is empty: {file_path}")
 
         except ConfigurationError:
             raise
@@ -85,11 +76,12 @@ class ConfigLoader:
         except Exception as e:
             raise ConfigurationError(f"Failed to process accounts file: {str(e)} | File: {filename}")
 
+        return source
 
     def load(self) -> Config | None:
         try:
             params = self._load_yaml()
-            wallets = list(self._parse_accounts("wallets.txt"))
+            wallets = self._load_wallets("wallets.txt")
 
             return Config(
                 **params,
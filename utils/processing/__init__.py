@@ -1 +1,2 @@
 from .progress import *
+from .metrics import *
@@ -0,0 +1,48 @@
+import math
+
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterable, Optional
+
+
+def percentile(values: Iterable[float], percentile: float) -> Optional[float]:
+    values = sorted(values)
+    if not values:
+        return None
+
+    index = min(len(values) - 1, max(0, math.ceil(percentile / 100 * len(values)) - 1))
+    return values[index]
+
+
+class Metrics:
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.gauges: Dict[str, float] = {}
+        self.samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+
+    def increment(self, name: str, value: int = 1):
+        self.counters[name] += value
+
+    def set_gauge(self, name: str, value: float):
+        self.gauges[name] = value
+
+    def observe(self, name: str, value: float):
+        self.samples[name].append(value)
+
+    def percentile(self, name: str, value: float) -> Optional[float]:
+        return percentile(self.samples.get(name, ()), value)
+
+    def reset(self):
+        self.counters.clear()
+        self.gauges.clear()
+        self.samples.clear()
+
+    def summary(self) -> str:
+        parts = [f"{name}={value}" for name, value in sorted(self.counters.items())]
+        parts += [f"{name}={value:g}" for name, value in sorted(self.gauges.items())]
+        for name in sorted(self.samples):
+            p50, p95 = self.percentile(name, 50), self.percentile(name, 95)
+            if p50 is not None:
+                parts.append(f"{name}_p50={p50:.3f}s {name}_p95={p95:.3f}s")
+
+        return " | ".join(parts)